@@ -6,37 +6,78 @@ Chromium 多实例管理器
 
 import sys
 import os
+import io
+import mmap
+import json
+import re
+import time
+import hashlib
+import uuid
+import pickle
 import yaml
 import psutil
 import subprocess
 import shutil
+import stat
 import webbrowser
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import platform
 import zipfile
 import tarfile
 import threading
 import logging
-from typing import Dict, List, Optional, Tuple, Any
+import logging.handlers
+import queue
+import atexit
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_EXCEPTION
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple, Any, Union
 from pathlib import Path
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                             QHBoxLayout, QPushButton, QTableWidget, QTableWidgetItem,
                             QLabel, QLineEdit, QMessageBox, QDialog, QFormLayout,
-                            QComboBox, QCheckBox, QHeaderView, QStyle, QStyleOptionButton,
+                            QComboBox, QHeaderView, QStyle, QStyleOptionButton,
                             QGroupBox, QProgressBar, QTextEdit, QGridLayout, QListWidget, QListWidgetItem)
-from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QEvent, QRect, QTimer, QThread, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QPainter, QPixmap
+
+# 优先使用 libyaml 提供的C实现，未安装时回退到纯Python版本
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
+# 优先使用 orjson 解析JSON，未安装时回退到标准库
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
 
 # 常量定义
 class Constants:
     # 网络超时设置
     IP_INFO_TIMEOUT = 5
     VERSION_FETCH_TIMEOUT = 10
+    FETCH_THREAD_EXIT_WAIT = 500  # 关闭窗口时等待网络请求线程结束的最长时间（毫秒）
     
     # 更新间隔
     PROCESS_STATUS_UPDATE_INTERVAL = 3000  # 3秒，降低频率
+    PROCESS_STATUS_IDLE_TICKS = 5  # 连续多次无运行实例后降低检查频率
+    PROCESS_STATUS_IDLE_INTERVAL = PROCESS_STATUS_UPDATE_INTERVAL * 4
+    PROCESS_STATUS_BACKGROUND_INTERVAL = 5000  # 窗口不在前台时的检查间隔
+    CONFIG_SAVE_DELAY = 2000  # 配置修改后延迟写入文件的时间（毫秒），合并连续修改
     
     # 下载设置
-    DOWNLOAD_CHUNK_SIZE = 8192
+    DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB，下载时复用的读取缓冲区大小
+    IN_MEMORY_ARCHIVE_MAX_MB = 512  # 不超过该大小的ZIP直接在内存中下载并解压
+    DOWNLOAD_STATUS_INTERVAL = 0.1  # 未知文件大小时状态文字的最短更新间隔（秒）
+    DOWNLOAD_PARALLEL_PARTS = 4  # 服务器支持 Range 时分段并行下载的段数
+    DOWNLOAD_PARALLEL_MIN_MB = 16  # 小于该大小的文件不分段
     
     # 默认路径
     DEFAULT_WINDOWS_DATA_DIR = os.path.join("C:", "temp", "chromium")
@@ -48,6 +89,52 @@ class Constants:
     # IP信息API
     IP_INFO_URL = "http://iprust.io/ip.json"
     
+    # HTTP缓存有效期（秒），过期后使用 ETag/Last-Modified 重新校验
+    RELEASES_CACHE_MAX_AGE = 3600
+    IP_INFO_CACHE_MAX_AGE = 300
+    
+    # has_version 结果的缓存时间（秒）
+    HAS_VERSION_CACHE_TTL = 1.0
+    
+    # 进程 stderr 只保留的最后行数和最多读取的字节数
+    STDERR_TAIL_LINES = 64
+    STDERR_TAIL_BYTES = 64 * 1024
+    # 实例启动后多久检查 stderr 日志中的错误（毫秒）
+    STDERR_CHECK_DELAY = 3000
+    # stderr 日志超过该大小时轮转，避免长时间运行的实例写满磁盘
+    STDERR_LOG_MAX_BYTES = 1024 * 1024
+    
+    # 每个实例都附加的固定启动参数
+    CHROMIUM_STATIC_ARGS = (
+        "--no-first-run",
+        "--disable-default-apps",
+        "--disable-background-mode",
+    )
+    
+    # 信息展示模板，缺失的字段显示为空
+    IP_INFO_TEMPLATE = "IP: {ip}\n国家: {country_long}\n城市: {city}\n时区: {timezone}"
+    ENV_INFO_TEMPLATE = (
+        "语言: 基于 IP 匹配\n"
+        "时区: {timezone}\n"
+        "分辨率: {resolution}\n"
+        "字体指纹: {font_fingerprint}\n"
+        "WebRTC: {webrtc}\n"
+        "WebGL 图像: {webgl_image}\n"
+        "WebGL Info: {webgl_info}\n"
+        "Canvas: {canvas}\n"
+        "AudioContext: {audiocontext}\n"
+        "Speech Voices: {speech_voices}\n"
+        "Do Not Track: {do_not_track}\n"
+        "Client Rects: {client_rects}\n"
+        "媒体设备: {media_devices}\n"
+        "设备名称: {device_name}\n"
+        "MAC地址: {mac_address}\n"
+        "硬件并发数: {hardware_concurrency}核\n"
+        "设备内存: {device_memory}G\n"
+        "SSL指纹设置: {ssl_fingerprint}\n"
+        "喇叭扫描保护: {speaker_protection}\n"
+    )
+    
     # 指纹验证网站
     FINGERPRINT_SITES = [
         ("Bot Sannysoft", "https://bot.sannysoft.com/"),
@@ -56,57 +143,383 @@ class Constants:
         ("CreepJS", "https://abrahamjuliot.github.io/creepjs/")
     ]
 
-# 配置日志
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# 配置日志：记录先放入队列，由后台线程负责格式化和写入，避免阻塞UI及下载线程
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+logging.basicConfig(level=logging.INFO, format='%(message)s',
+                    handlers=[logging.handlers.QueueHandler(_log_queue)])
 logger = logging.getLogger(__name__)
 
+# 复用同一个空设备句柄，避免每次启动进程都重新打开 os.devnull
+DEVNULL = open(os.devnull, 'wb')
+
+def _make_session(retries: int, backoff_factor: float = 0) -> requests.Session:
+    """创建复用连接和TLS握手的HTTP会话"""
+    session = requests.Session()
+    session.headers['User-Agent'] = 'chromium-manager/2.0'
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                          max_retries=Retry(total=retries, backoff_factor=backoff_factor))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+# IP信息、版本列表等元数据请求不重试，网络不通时尽快失败，避免拖慢启动和关闭
+http_session = _make_session(retries=0)
+# 下载安装包时对连接失败自动重试
+download_session = _make_session(retries=3, backoff_factor=0.5)
+
+class HttpCache:
+    """基于磁盘的HTTP响应缓存，支持 ETag/Last-Modified 条件请求"""
+    
+    @staticmethod
+    def _cache_file(cache_dir: str, url: str) -> str:
+        return os.path.join(cache_dir, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.json')
+    
+    @staticmethod
+    def _write(path: str, entry: Dict):
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+        except OSError as e:
+            logger.warning(f"写入HTTP缓存失败: {e}")
+    
+    @staticmethod
+    def _read(path: str) -> Optional[Dict]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    @staticmethod
+    def peek(url: str, cache_dir: str) -> Optional[str]:
+        """只读取本地缓存，不发送网络请求"""
+        cached = HttpCache._read(HttpCache._cache_file(cache_dir, url))
+        return cached['body'] if cached else None
+    
+    @staticmethod
+    def get(url: str, cache_dir: str, max_age: float, timeout: float,
+            stale_on_error: bool = True) -> Tuple[str, bool]:
+        """获取URL内容，缓存未过期时直接返回，否则发送条件请求
+        
+        返回 (内容, 是否为新内容)，内容未变化（缓存命中或304）时第二项为 False。
+        stale_on_error 为 False 时网络出错不回退到已过期的缓存，而是直接抛出异常。
+        """
+        path = HttpCache._cache_file(cache_dir, url)
+        cached = HttpCache._read(path)
+        
+        if cached and time.time() - cached.get('fetched_at', 0) < max_age:
+            return cached['body'], False
+        
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        
+        try:
+            resp = http_session.get(url, headers=headers, timeout=timeout)
+            if resp.status_code == 304 and cached:
+                cached['fetched_at'] = time.time()
+                HttpCache._write(path, cached)
+                return cached['body'], False
+            resp.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            if cached and stale_on_error:
+                logger.warning(f"网络错误，使用缓存数据: {e}")
+                return cached['body'], False
+            raise
+        
+        HttpCache._write(path, {
+            'etag': resp.headers.get('ETag'),
+            'last_modified': resp.headers.get('Last-Modified'),
+            'fetched_at': time.time(),
+            'body': resp.text
+        })
+        return resp.text, True
+
+class DownloadCancelled(Exception):
+    """下载被用户取消"""
+
+
+class RangeNotSupported(Exception):
+    """服务器忽略了 Range 请求头，返回了完整内容"""
+
+
+class ProgressReader(io.RawIOBase):
+    """包装下载流，在读取时统计字节数并检查取消状态"""
+    
+    def __init__(self, raw, on_read, is_cancelled):
+        super().__init__()
+        self._raw = raw
+        self._on_read = on_read
+        self._is_cancelled = is_cancelled
+        
+    def readable(self) -> bool:
+        return True
+        
+    def readinto(self, buffer) -> int:
+        if self._is_cancelled():
+            raise DownloadCancelled()
+        n = self._raw.readinto(buffer)
+        if n:
+            self._on_read(n)
+        return n
+
+class MmapFile(io.RawIOBase):
+    """内存映射文件或内存中数据的只读视图，多个实例可共享同一份数据并各自维护读取位置"""
+    
+    def __init__(self, mm: Union[mmap.mmap, bytes, bytearray]):
+        super().__init__()
+        self._mm = mm
+        self._pos = 0
+        
+    def readable(self) -> bool:
+        return True
+        
+    def seekable(self) -> bool:
+        return True
+        
+    def tell(self) -> int:
+        return self._pos
+        
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._mm)
+        self._pos = max(offset, 0)
+        return self._pos
+        
+    def read(self, size: Optional[int] = -1) -> bytes:
+        end = len(self._mm) if size is None or size < 0 else min(len(self._mm), self._pos + size)
+        data = self._mm[self._pos:end]
+        self._pos += len(data)
+        return data
+        
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
 class DownloadThread(QThread):
     """下载线程，支持进度报告"""
     progress = pyqtSignal(int)
     status = pyqtSignal(str)
     finished = pyqtSignal(bool, str)
     
-    def __init__(self, url: str, filepath: str):
+    def __init__(self, url: str, filepath: str, in_memory: bool = False):
         super().__init__()
         self.url = url
         self.filepath = filepath
+        self.in_memory = in_memory
+        # 下载到内存时的压缩包数据
+        self.buffer: Optional[Union[bytes, bytearray]] = None
         self._is_cancelled = False
+        self._total_size = 0
+        self._downloaded = 0
+        self._last_progress = -1
+        self._last_status_time = 0.0
+        self._progress_lock = threading.Lock()
+        self._abort_parts = False
         
     def cancel(self):
         """取消下载"""
         self._is_cancelled = True
         
+    def _on_read(self, n: int):
+        """统计已下载字节数，只在百分比变化时发送信号，避免阻塞UI事件循环
+
+        状态文字由对话框根据进度自行生成；未知总大小时按时间节流发送已下载的大小。
+        """
+        if self._total_size > 0:
+            # 并行分段共用同一进度，比较、更新和发送都在锁内完成，避免进度回退或重复发送
+            with self._progress_lock:
+                self._downloaded += n
+                progress = self._downloaded * 100 // self._total_size
+                if progress != self._last_progress:
+                    self._last_progress = progress
+                    self.progress.emit(progress)
+        else:
+            self._downloaded += n
+            now = time.monotonic()
+            if now - self._last_status_time >= Constants.DOWNLOAD_STATUS_INTERVAL:
+                self._last_status_time = now
+                self.status.emit(f"下载中... {self._downloaded / (1024 * 1024):.1f}MB")
+        
+    @staticmethod
+    def _copy_stream(reader: io.RawIOBase, out):
+        """复用同一块预分配缓冲区读取数据，避免每个分块都分配新的 bytes 对象"""
+        buf = bytearray(Constants.DOWNLOAD_CHUNK_SIZE)
+        view = memoryview(buf)
+        while True:
+            n = reader.readinto(view)
+            if not n:
+                break
+            out.write(view[:n])
+        
+    @staticmethod
+    def _preallocate(f, size: int):
+        """按最终大小预先分配文件空间，避免边写边扩展；写入位置保持在文件开头"""
+        try:
+            if hasattr(os, 'posix_fallocate'):
+                os.posix_fallocate(f.fileno(), 0, size)
+                return
+        except OSError:
+            # 部分文件系统不支持，退回到设置文件长度
+            pass
+        # Windows 上对应 SetEndOfFile
+        f.truncate(size)
+        
+    def _can_split(self, response: requests.Response) -> bool:
+        """服务器支持 Range 且文件足够大时才分段下载"""
+        return (response.headers.get('accept-ranges', '').lower() == 'bytes'
+                and 'content-encoding' not in response.headers
+                and self._total_size >= Constants.DOWNLOAD_PARALLEL_MIN_MB * 1024 * 1024)
+        
+    def _should_stop(self) -> bool:
+        return self._is_cancelled or self._abort_parts
+        
+    def _fetch_range(self, url: str, start: int, end: int, sink):
+        """下载 [start, end] 字节区间，sink(reader) 负责把数据写到目标位置"""
+        headers = {'Range': f'bytes={start}-{end}'}
+        with download_session.get(url, headers=headers, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise RangeNotSupported()
+            reader = ProgressReader(response.raw, self._on_read, self._should_stop)
+            if sink(reader) != end - start + 1:
+                raise requests.exceptions.ConnectionError("分段下载提前结束")
+        
+    def _download_parallel(self, url: str):
+        """按 Range 分段并行下载，每段直接写入预分配的内存或文件中的对应位置"""
+        total = self._total_size
+        step = -(-total // Constants.DOWNLOAD_PARALLEL_PARTS)
+        ranges = [(start, min(start + step, total) - 1) for start in range(0, total, step)]
+        logger.info(f"分 {len(ranges)} 段并行下载")
+        
+        if self.in_memory:
+            data = bytearray(total)
+            view = memoryview(data)
+            
+            def fetch(start: int, end: int):
+                def sink(reader):
+                    pos = start
+                    while pos <= end:
+                        n = reader.readinto(view[pos:min(end + 1, pos + Constants.DOWNLOAD_CHUNK_SIZE)])
+                        if not n:
+                            break
+                        pos += n
+                    return pos - start
+                self._fetch_range(url, start, end, sink)
+        else:
+            with open(self.filepath, 'wb') as f:
+                self._preallocate(f, total)
+            
+            def fetch(start: int, end: int):
+                with open(self.filepath, 'r+b') as f:
+                    f.seek(start)
+                    def sink(reader):
+                        self._copy_stream(reader, f)
+                        return f.tell() - start
+                    self._fetch_range(url, start, end, sink)
+        
+        with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+            futures = [pool.submit(fetch, start, end) for start, end in ranges]
+            done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+            if any(future.exception() for future in done):
+                # 任意一段失败时让其余分段尽快停止
+                self._abort_parts = True
+        
+        errors = [future.exception() for future in futures if future.exception()]
+        if errors:
+            # 优先报告真正的错误，而不是因其失败而被中止的其他分段
+            raise next((e for e in errors if not isinstance(e, DownloadCancelled)), errors[0])
+        
+        if self.in_memory:
+            # 直接交出预分配的数据，不再复制一份
+            self.buffer = data
+        
+    def _download_stream(self, response: requests.Response):
+        """单连接顺序下载到内存或文件"""
+        # 直接读取底层流，跳过 iter_content 的生成器开销
+        # 仅在服务器声明了 Content-Encoding 时 urllib3 才会解码
+        raw = response.raw
+        raw.decode_content = True
+        reader = ProgressReader(raw, self._on_read, lambda: self._is_cancelled)
+        
+        if self.in_memory:
+            # 保存在内存中，解压时无需再写入并重新读取磁盘文件
+            out = io.BytesIO()
+            self._copy_stream(reader, out)
+            self.buffer = out.getvalue()
+        else:
+            with open(self.filepath, 'wb') as f:
+                if self._total_size > 0:
+                    self._preallocate(f, self._total_size)
+                self._copy_stream(reader, f)
+                # 实际长度与 Content-Length 不一致时去掉多余的预分配部分
+                f.truncate()
+        
+    def _reset_progress(self):
+        self._downloaded = 0
+        self._last_progress = -1
+        self._last_status_time = 0.0
+        self._abort_parts = False
+        
+    def _discard_partial(self):
+        """下载未成功时丢弃已写入的数据，包括预分配的文件"""
+        self.buffer = None
+        if not self.in_memory:
+            try:
+                os.remove(self.filepath)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"删除未完成的下载文件失败: {e}")
+        
     def run(self):
         """执行下载"""
         try:
             self.status.emit("开始下载...")
             logger.info(f"开始下载: {self.url}")
             
-            response = requests.get(self.url, stream=True, timeout=30)
+            response = download_session.get(self.url, stream=True, timeout=30)
             response.raise_for_status()
             
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded = 0
+            self._total_size = int(response.headers.get('content-length', 0))
+            self._reset_progress()
             
-            with open(self.filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=Constants.DOWNLOAD_CHUNK_SIZE):
-                    if self._is_cancelled:
-                        f.close()
-                        if os.path.exists(self.filepath):
-                            os.remove(self.filepath)
-                        self.finished.emit(False, "下载已取消")
-                        return
-                        
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        if total_size > 0:
-                            progress = int((downloaded / total_size) * 100)
-                            self.progress.emit(progress)
-                            self.status.emit(f"下载中... {progress}%")
+            try:
+                if self._can_split(response):
+                    # 使用重定向后的最终地址分段请求，释放这次的连接
+                    response.close()
+                    try:
+                        self._download_parallel(response.url)
+                    except RangeNotSupported:
+                        # 服务器实际返回了完整内容，改为单连接下载
+                        logger.info("服务器未按分段返回数据，改为单连接下载")
+                        self._reset_progress()
+                        response = download_session.get(self.url, stream=True, timeout=30)
+                        response.raise_for_status()
+                        self._download_stream(response)
+                else:
+                    self._download_stream(response)
+            except DownloadCancelled:
+                self._discard_partial()
+                self.finished.emit(False, "下载已取消")
+                return
+            except Exception:
+                self._discard_partial()
+                raise
             
             self.status.emit("下载完成")
-            logger.info(f"下载完成: {self.filepath}")
+            logger.info(f"下载完成: {'内存' if self.in_memory else self.filepath}")
             self.finished.emit(True, "")
             
         except requests.exceptions.RequestException as e:
@@ -119,65 +532,210 @@ class DownloadThread(QThread):
             logger.error(f"下载失败: {e}")
             self.finished.emit(False, f"未知错误: {str(e)}")
 
+# 关闭窗口时仍未结束的网络请求线程，保留引用直到进程退出
+_detached_threads: List[QThread] = []
+
+class FetchThread(QThread):
+    """后台执行网络请求，避免阻塞UI线程"""
+    result = pyqtSignal(object)
+    
+    def __init__(self, func):
+        super().__init__()
+        self._func = func
+        
+    def run(self):
+        """执行请求并发送结果"""
+        self.result.emit(self._func())
+
 class FileExtractor:
     """文件解压器"""
     
     @staticmethod
-    def extract_zip(filepath: str, extract_dir: str, version_tag: str, platform_dir: str, parent) -> bool:
-        """解压ZIP文件"""
+    def stat_file(path: str) -> Optional[os.stat_result]:
+        """返回普通文件的 stat 结果，不存在或不是文件时返回 None"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st if stat.S_ISREG(st.st_mode) else None
+    
+    @staticmethod
+    def remove_dir_async(path: str):
+        """先重命名再在后台线程删除，避免目录删除阻塞界面和安装流程；重命名失败时同步删除，出错会抛出异常"""
+        trash = f"{path}.trash-{uuid.uuid4().hex}"
+        try:
+            os.replace(path, trash)
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            # 无法重命名（如文件被占用）时同步删除
+            logger.warning(f"重命名目录失败，直接删除: {e}")
+            shutil.rmtree(path)
+            return
+        QThreadPool.globalInstance().start(lambda: shutil.rmtree(trash, ignore_errors=True))
+    
+    @staticmethod
+    def _member_parent_dir(dest_dir: str, info: zipfile.ZipInfo) -> str:
+        """计算成员解压后的父目录（与 zipfile 的路径清理规则一致）"""
+        arcname = info.filename.replace('/', os.path.sep)
+        if os.path.altsep:
+            arcname = arcname.replace(os.path.altsep, os.path.sep)
+        arcname = os.path.splitdrive(arcname)[1]
+        parts = [x for x in arcname.split(os.path.sep) if x not in ('', os.path.curdir, os.path.pardir)]
+        if not info.is_dir():
+            parts = parts[:-1]
+        return os.path.join(dest_dir, *parts)
+    
+    @staticmethod
+    def _extract_zip_parallel(archive: Union[str, bytes, bytearray], dest_dir: str):
+        """多线程解压ZIP，每个成员独立压缩，可并行解压"""
+        mm: Optional[mmap.mmap] = None
+        if isinstance(archive, str):
+            # 磁盘上的压缩包映射到内存，各线程共享同一映射，减少一次内核到用户态的复制
+            with open(archive, 'rb') as fh:
+                mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_WILLNEED'):
+                mm.madvise(mmap.MADV_WILLNEED)
+        
+        def open_zip() -> zipfile.ZipFile:
+            # 每个视图共享同一份映射或内存数据，只各自维护读取位置
+            source = MmapFile(mm if mm is not None else archive)
+            return zipfile.ZipFile(source, 'r', allowZip64=True)
+        
+        try:
+            FileExtractor._extract_members(open_zip, dest_dir)
+        finally:
+            if mm is not None:
+                mm.close()
+    
+    @staticmethod
+    def _extract_members(open_zip, dest_dir: str):
+        """使用线程池解压所有成员，open_zip 为每个线程创建独立的 ZipFile"""
+        with open_zip() as zip_ref:
+            infos = zip_ref.infolist()
+        
+        # 先顺序创建所有目录，避免工作线程并发创建目录产生竞争
+        dirs = {FileExtractor._member_parent_dir(dest_dir, info) for info in infos}
+        for directory in sorted(dirs):
+            os.makedirs(directory, exist_ok=True)
+        
+        # 大文件优先提交，负载更均衡
+        members = sorted((info for info in infos if not info.is_dir()),
+                         key=lambda info: info.file_size, reverse=True)
+        
+        # ZipFile 不是线程安全的，每个工作线程打开自己的句柄
+        local = threading.local()
+        handles = []
+        handles_lock = threading.Lock()
+        
+        def extract(info: zipfile.ZipInfo):
+            zf = getattr(local, 'zf', None)
+            if zf is None:
+                zf = local.zf = open_zip()
+                with handles_lock:
+                    handles.append(zf)
+            zf.extract(info, dest_dir)
+        
+        try:
+            with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as executor:
+                # 消费结果以便抛出工作线程中的异常
+                for _ in executor.map(extract, members):
+                    pass
+        finally:
+            for zf in handles:
+                zf.close()
+    
+    @staticmethod
+    def extract_zip(archive: Union[str, bytes, bytearray], version_tag: str, platform_dir: str) -> Optional[str]:
+        """解压ZIP文件，archive 可以是文件路径或已下载到内存的数据；返回可执行文件路径，失败时返回 None
+
+        不涉及UI和配置，可在后台线程调用。
+        """
         try:
-            tmp_extract_dir = os.path.join(extract_dir, f"tmp_extract_{version_tag}")
+            # 临时目录与目标目录位于同一文件系统，解压后可直接重命名
+            version_dir = os.path.join(platform_dir, version_tag)
+            tmp_extract_dir = version_dir + ".tmp"
             
             # 清理并创建临时目录
-            if os.path.exists(tmp_extract_dir):
-                shutil.rmtree(tmp_extract_dir)
-            os.makedirs(tmp_extract_dir, exist_ok=True)
+            FileExtractor.remove_dir_async(tmp_extract_dir)
+            os.makedirs(tmp_extract_dir)
             
             # 解压文件
-            with zipfile.ZipFile(filepath, 'r') as zip_ref:
-                zip_ref.extractall(tmp_extract_dir)
-            
-            # 移动到目标版本目录
-            version_dir = os.path.join(platform_dir, version_tag)
-            if os.path.exists(version_dir):
-                shutil.rmtree(version_dir)
-            os.makedirs(version_dir, exist_ok=True)
+            FileExtractor._extract_zip_parallel(archive, tmp_extract_dir)
             
-            # 复制文件
-            for item in os.listdir(tmp_extract_dir):
-                s = os.path.join(tmp_extract_dir, item)
-                d = os.path.join(version_dir, item)
-                if os.path.isdir(s):
-                    shutil.copytree(s, d, dirs_exist_ok=True)
-                else:
-                    shutil.copy2(s, d)
+            # 移动到目标版本目录（一次重命名代替逐个复制文件）
+            FileExtractor.remove_dir_async(version_dir)
+            os.replace(tmp_extract_dir, version_dir)
             
-            # 清理临时目录
-            shutil.rmtree(tmp_extract_dir)
+            # 查找chrome.exe（scandir 一次读取目录项，复用其缓存的类型信息）
+            with os.scandir(version_dir) as it:
+                entries = {entry.name: entry for entry in it}
             
-            # 查找chrome.exe
-            chrome_paths = [
-                os.path.join(version_dir, 'chrome.exe'),
-                os.path.join(version_dir, 'Chromium', 'chrome.exe'),
-                os.path.join(version_dir, 'chrome-win', 'chrome.exe')
-            ]
+            chrome_paths = []
+            entry = entries.get('chrome.exe')
+            if entry and entry.is_file():
+                chrome_paths.append(entry.path)
+            for sub_dir in ('Chromium', 'chrome-win'):
+                entry = entries.get(sub_dir)
+                if entry and entry.is_dir():
+                    chrome_paths.append(os.path.join(entry.path, 'chrome.exe'))
             
             for path in chrome_paths:
-                if os.path.exists(path):
-                    parent.update_version_config(version_tag, path)
+                if FileExtractor.stat_file(path):
                     logger.info(f"Chrome可执行文件找到: {path}")
-                    return True
+                    return path
                     
             logger.error("未找到chrome.exe")
-            return False
+            return None
             
         except Exception as e:
             logger.error(f"ZIP解压失败: {e}")
-            return False
+            return None
     
     @staticmethod
-    def extract_dmg(filepath: str, version_tag: str, platform_dir: str, parent) -> bool:
-        """解压DMG文件"""
+    def _copy_app_bundle(src: str, dst: str):
+        """复制 .app 包，优先使用系统工具"""
+        # 同一文件系统（APFS）上 cp -c 走 clonefile，只复制元数据
+        # 跨文件系统（如从挂载的DMG复制）时使用原生的 ditto
+        same_device = os.stat(src).st_dev == os.stat(os.path.dirname(dst)).st_dev
+        cmd = ['cp', '-cR', src, dst] if same_device else ['ditto', src, dst]
+        try:
+            subprocess.run(cmd, check=True, capture_output=True, timeout=600)
+            return
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.warning(f"{cmd[0]} 复制失败，回退到 shutil.copytree: {e}")
+        
+        FileExtractor.remove_dir_async(dst)
+        shutil.copytree(src, dst, symlinks=True)
+    
+    @staticmethod
+    def _find_app_bundle(root: str, name: str) -> Optional[str]:
+        """按层级广度优先查找应用包，找到即停止
+
+        使用 scandir 自带的类型信息，不进入其他 .app 包，也不跟随符号链接，
+        避免误入DMG中指向 /Applications 的链接。
+        """
+        pending = [root]
+        while pending:
+            next_level = []
+            for directory in pending:
+                try:
+                    with os.scandir(directory) as it:
+                        for entry in it:
+                            if not entry.is_dir(follow_symlinks=False):
+                                continue
+                            if entry.name == name:
+                                return entry.path
+                            if not entry.name.endswith('.app'):
+                                next_level.append(entry.path)
+                except OSError:
+                    continue
+            pending = next_level
+        return None
+    
+    @staticmethod
+    def extract_dmg(filepath: str, version_tag: str, platform_dir: str) -> Optional[str]:
+        """解压DMG文件，返回可执行文件路径，失败时返回 None；不涉及UI和配置，可在后台线程调用"""
         try:
             version_dir = os.path.join(platform_dir, version_tag)
             os.makedirs(version_dir, exist_ok=True)
@@ -186,52 +744,113 @@ class FileExtractor:
             os.makedirs(mount_point, exist_ok=True)
             
             try:
-                # 挂载DMG文件
-                mount_cmd = ['hdiutil', 'attach', filepath, '-mountpoint', mount_point, '-readonly']
+                # 挂载DMG文件（跳过校验、不在 Finder 中显示）
+                mount_cmd = ['hdiutil', 'attach', filepath, '-mountpoint', mount_point, '-readonly',
+                             '-noverify', '-noautoopen', '-nobrowse', '-quiet']
                 result = subprocess.run(mount_cmd, capture_output=True, text=True, timeout=60)
                 
                 if result.returncode != 0:
                     logger.error(f"DMG挂载失败: {result.stderr}")
-                    return False
+                    return None
                 
                 # 查找Chromium.app
-                chromium_app_path = None
-                for root, dirs, files in os.walk(mount_point):
-                    if 'Chromium.app' in dirs:
-                        chromium_app_path = os.path.join(root, 'Chromium.app')
-                        break
-                
+                chromium_app_path = FileExtractor._find_app_bundle(mount_point, 'Chromium.app')
                 if not chromium_app_path:
                     logger.error("在DMG中未找到Chromium.app")
-                    return False
+                    return None
                 
                 # 复制Chromium.app
                 target_path = os.path.join(version_dir, 'Chromium.app')
-                if os.path.exists(target_path):
-                    shutil.rmtree(target_path)
+                FileExtractor.remove_dir_async(target_path)
                 
-                shutil.copytree(chromium_app_path, target_path)
+                FileExtractor._copy_app_bundle(chromium_app_path, target_path)
                 
-                # 更新版本配置
                 chromium_exe_path = os.path.join(target_path, 'Contents', 'MacOS', 'Chromium')
-                if os.path.exists(chromium_exe_path):
-                    parent.update_version_config(version_tag, chromium_exe_path)
+                if FileExtractor.stat_file(chromium_exe_path):
                     logger.info(f"Chromium可执行文件找到: {chromium_exe_path}")
-                    return True
+                    return chromium_exe_path
                 
-                return False
+                return None
                 
             finally:
                 # 卸载DMG文件
                 try:
-                    subprocess.run(['hdiutil', 'detach', mount_point], 
+                    subprocess.run(['hdiutil', 'detach', mount_point, '-quiet'], 
                                  capture_output=True, timeout=30)
                 except subprocess.TimeoutExpired:
                     logger.warning("DMG卸载超时")
                 
         except Exception as e:
             logger.error(f"DMG解压失败: {e}")
-            return False
+            return None
+
+class ExtractThread(QThread):
+    """后台解压线程，避免大文件解压阻塞UI"""
+    log = pyqtSignal(str)
+    done = pyqtSignal(object, str)  # 可执行文件路径（失败时为 None）、压缩包的 SHA256
+    
+    def __init__(self, archive: Union[str, bytes, bytearray], filepath: str, version_tag: str, platform_dir: str,
+                 installed: Optional[Dict] = None):
+        super().__init__()
+        self.archive = archive
+        self.filepath = filepath
+        self.version_tag = version_tag
+        self.platform_dir = platform_dir
+        # 该版本当前的配置（包含可执行文件路径和上次安装的压缩包哈希）
+        self.installed = installed or {}
+        
+    @staticmethod
+    def _archive_sha256(archive: Union[str, bytes, bytearray]) -> str:
+        """计算压缩包的 SHA256，文件按块读取"""
+        if not isinstance(archive, str):
+            return hashlib.sha256(archive).hexdigest()
+        digest = hashlib.sha256()
+        with open(archive, 'rb') as f:
+            for chunk in iter(lambda: f.read(Constants.DOWNLOAD_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+        
+    def run(self):
+        """解压并清理下载的压缩文件"""
+        filepath = self.filepath
+        try:
+            digest = self._archive_sha256(self.archive)
+            installed_path = self.installed.get('path')
+            if (digest == self.installed.get('archive_sha256') and installed_path
+                    and FileExtractor.stat_file(installed_path)):
+                # 与已安装的是同一个压缩包，跳过解压
+                self.log.emit("✅ 该版本已安装且内容一致，跳过解压")
+                path = installed_path
+            elif filepath.endswith('.zip'):
+                path = FileExtractor.extract_zip(self.archive, self.version_tag, self.platform_dir)
+                if path:
+                    self.log.emit("✅ ZIP文件处理完成！")
+            elif filepath.endswith('.dmg'):
+                path = FileExtractor.extract_dmg(filepath, self.version_tag, self.platform_dir)
+                if path:
+                    self.log.emit("✅ DMG文件处理完成！")
+            else:
+                self.log.emit(f"❌ 不支持的文件格式: {filepath}")
+                self.done.emit(None, "")
+                return
+            
+            # 释放内存中的压缩数据
+            self.archive = None
+            
+            if path and os.path.exists(filepath):
+                # 删除下载的压缩文件
+                try:
+                    os.remove(filepath)
+                    self.log.emit("临时文件已清理")
+                except Exception as e:
+                    logger.warning(f"清理临时文件失败: {e}")
+            
+            self.done.emit(path, digest)
+            
+        except Exception as e:
+            logger.error(f"解压文件失败: {e}")
+            self.log.emit(f"❌ 处理文件失败: {str(e)}")
+            self.done.emit(None, "")
 
 class DownloadDialog(QDialog):
     """下载对话框"""
@@ -241,6 +860,7 @@ class DownloadDialog(QDialog):
         self.setWindowTitle("下载 Chromium")
         self.version_info = version_info
         self.download_thread: Optional[DownloadThread] = None
+        self.extract_thread: Optional[ExtractThread] = None
         self.setup_ui()
         
     def setup_ui(self):
@@ -290,15 +910,24 @@ class DownloadDialog(QDialog):
             return
             
         self.download_btn.setEnabled(False)
+        # 体积适中的ZIP直接下载到内存；DMG需要 hdiutil 挂载真实文件
+        in_memory = (self.version_info['filepath'].endswith('.zip') and
+                     self.version_info['size'] <= Constants.IN_MEMORY_ARCHIVE_MAX_MB)
         self.download_thread = DownloadThread(
             self.version_info['download_url'], 
-            self.version_info['filepath']
+            self.version_info['filepath'],
+            in_memory
         )
-        self.download_thread.progress.connect(self.progress_bar.setValue)
+        self.download_thread.progress.connect(self._on_download_progress)
         self.download_thread.status.connect(self.status_label.setText)
         self.download_thread.finished.connect(self.download_finished)
         self.download_thread.start()
     
+    def _on_download_progress(self, progress: int):
+        """更新进度条和状态文字"""
+        self.progress_bar.setValue(progress)
+        self.status_label.setText(f"下载中... {progress}%")
+        
     def cancel_download(self):
         """取消下载"""
         if self.download_thread and self.download_thread.isRunning():
@@ -316,51 +945,42 @@ class DownloadDialog(QDialog):
             self.download_btn.setEnabled(True)
             
     def extract_file(self):
-        """解压文件"""
+        """在后台线程中解压文件"""
         if not self.version_info:
             return
             
-        try:
-            filepath = self.version_info['filepath']
-            download_dir = os.path.dirname(filepath)
-            version_tag = self.version_info['tag_name']
-            
-            success = False
-            if filepath.endswith('.zip'):
-                success = FileExtractor.extract_zip(
-                    filepath, download_dir, version_tag, 
-                    self.parent().platform_dir, self.parent()
-                )
-                if success:
-                    self.log_text.append("✅ ZIP文件处理完成！")
-            elif filepath.endswith('.dmg'):
-                success = FileExtractor.extract_dmg(
-                    filepath, version_tag, 
-                    self.parent().platform_dir, self.parent()
-                )
-                if success:
-                    self.log_text.append("✅ DMG文件处理完成！")
-            else:
-                self.log_text.append(f"❌ 不支持的文件格式: {filepath}")
-                return
-            
-            if success:
-                # 删除下载的压缩文件
-                try:
-                    os.remove(filepath)
-                    self.log_text.append("临时文件已清理")
-                except Exception as e:
-                    logger.warning(f"清理临时文件失败: {e}")
-                
-                self.accept()
-            else:
-                self.log_text.append("❌ 文件处理失败")
-                self.download_btn.setEnabled(True)
-                
-        except Exception as e:
-            logger.error(f"解压文件失败: {e}")
-            self.log_text.append(f"❌ 处理文件失败: {str(e)}")
+        filepath = self.version_info['filepath']
+        buffer = self.download_thread.buffer if self.download_thread else None
+        archive = buffer if buffer is not None else filepath
+        if self.download_thread:
+            self.download_thread.buffer = None
+        
+        self.cancel_btn.setEnabled(False)
+        version_tag = self.version_info['tag_name']
+        self.extract_thread = ExtractThread(
+            archive, filepath, version_tag, self.parent().platform_dir,
+            self.parent().config.get('versions', {}).get(version_tag)
+        )
+        self.extract_thread.log.connect(self.log_text.append)
+        self.extract_thread.done.connect(self.extract_finished)
+        self.extract_thread.start()
+    
+    def extract_finished(self, path: Optional[str], archive_sha256: str):
+        """解压完成处理，在UI线程中更新版本配置"""
+        self.cancel_btn.setEnabled(True)
+        if path:
+            self.parent().update_version_config(self.version_info['tag_name'], path,
+                                                archive_sha256=archive_sha256)
+            self.accept()
+        else:
+            self.log_text.append("❌ 文件处理失败")
             self.download_btn.setEnabled(True)
+    
+    def reject(self):
+        """解压过程中不允许关闭对话框"""
+        if self.extract_thread and self.extract_thread.isRunning():
+            return
+        super().reject()
 
 class CheckBoxHeader(QHeaderView):
     """支持全选的表头"""
@@ -370,6 +990,14 @@ class CheckBoxHeader(QHeaderView):
         self.isChecked = False
         self.setSectionsClickable(True)
         self.sectionClicked.connect(self.on_section_clicked)
+        
+        # 预先构建两种状态的复选框样式，避免每次重绘时重新创建
+        self._opt_on = QStyleOptionButton()
+        self._opt_on.state = QStyle.StateFlag.State_Enabled | QStyle.StateFlag.State_On
+        self._opt_off = QStyleOptionButton()
+        self._opt_off.state = QStyle.StateFlag.State_Enabled | QStyle.StateFlag.State_Off
+        # 是否选中 -> ((宽, 高, 设备像素比), 已绘制好的复选框)，每种状态只保留一张，尺寸变化时重建
+        self._pixmap_cache: Dict[bool, Tuple[Tuple[int, int, float], QPixmap]] = {}
 
     def on_section_clicked(self, logical_index: int):
         """处理表头点击"""
@@ -383,57 +1011,80 @@ class CheckBoxHeader(QHeaderView):
     def paintSection(self, painter, rect, logical_index: int):
         """绘制表头"""
         super().paintSection(painter, rect, logical_index)
-        if logical_index == 0:  # 只在第一列绘制复选框
-            option = QStyleOptionButton()
-            option.rect = rect
-            option.state = QStyle.StateFlag.State_Enabled
-            if self.isChecked:
-                option.state |= QStyle.StateFlag.State_On
-            else:
-                option.state |= QStyle.StateFlag.State_Off
-            QApplication.style().drawControl(QStyle.ControlElement.CE_CheckBox, option, painter)
+        if logical_index:  # 只在第一列绘制复选框
+            return
+        dpr = self.devicePixelRatioF()
+        size = (rect.width(), rect.height(), dpr)
+        cached = self._pixmap_cache.get(self.isChecked)
+        if cached and cached[0] == size:
+            pixmap = cached[1]
+        else:
+            pixmap = self._render_checkbox(rect.width(), rect.height(), dpr)
+            self._pixmap_cache[self.isChecked] = (size, pixmap)
+        painter.drawPixmap(rect.topLeft(), pixmap)
+
+    def _render_checkbox(self, width: int, height: int, dpr: float) -> QPixmap:
+        """把复选框绘制到透明位图中，之后的重绘直接复用"""
+        pixmap = QPixmap(round(width * dpr), round(height * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        option = self._opt_on if self.isChecked else self._opt_off
+        option.rect = QRect(0, 0, width, height)
+        pixmap_painter = QPainter(pixmap)
+        QApplication.style().drawControl(QStyle.ControlElement.CE_CheckBox, option, pixmap_painter)
+        pixmap_painter.end()
+        return pixmap
 
 class InstanceUtils:
     """实例工具类，减少重复代码"""
     
-    @staticmethod
-    def get_next_number(instances: List[Dict], field: str, prefix: str = "", start: int = 1) -> int:
-        """获取下一个可用的数字"""
-        existing_numbers = []
-        for inst in instances:
-            value = inst.get(field, "")
-            if isinstance(value, str) and value.startswith(prefix):
-                try:
-                    num = int(value[len(prefix):])
-                    existing_numbers.append(num)
-                except ValueError:
-                    continue
-            elif isinstance(value, int):
-                existing_numbers.append(value)
-        return max(existing_numbers, default=start - 1) + 1
+    # 编号解析用的正则只编译一次：实例名称 "Instance N"、各平台的默认数据目录 ".../defaultN"
+    _INSTANCE_NAME_RE = re.compile(r'Instance (\d+)$')
+    _DATA_DIR_RES = {
+        True: re.compile(re.escape(f"{Constants.DEFAULT_WINDOWS_DATA_DIR}/default") + r'(\d+)$'),
+        False: re.compile(re.escape(f"{Constants.DEFAULT_MACOS_DATA_DIR}/default") + r'(\d+)$'),
+    }
     
     @staticmethod
-    def get_next_data_dir_number(instances: List[Dict], is_windows: bool) -> int:
-        """获取下一个数据目录编号"""
-        existing_dirs = []
-        base_path = Constants.DEFAULT_WINDOWS_DATA_DIR if is_windows else Constants.DEFAULT_MACOS_DATA_DIR
+    def get_next_numbers(instances: List[Dict], is_windows: bool) -> Tuple[int, int, int]:
+        """一次遍历获取下一个实例编号、数据目录编号和指纹编号"""
+        name_re = InstanceUtils._INSTANCE_NAME_RE
+        data_dir_re = InstanceUtils._DATA_DIR_RES[is_windows]
+        max_instance = 0
+        max_data_dir = 0
+        max_fingerprint: Optional[int] = None
         
         for inst in instances:
-            dir_path = inst.get('user_data_dir', '')
-            if f"{base_path}/default" in dir_path:
-                try:
-                    num = int(dir_path.split('default')[-1])
-                    existing_dirs.append(num)
-                except ValueError:
-                    continue
-        return max(existing_dirs, default=0) + 1
+            name = inst.get('name', "")
+            if isinstance(name, int):
+                max_instance = max(max_instance, name)
+            elif isinstance(name, str):
+                m = name_re.match(name)
+                if m:
+                    max_instance = max(max_instance, int(m.group(1)))
+            
+            fingerprint = inst.get('fingerprint', "")
+            if isinstance(fingerprint, str) and fingerprint.isdecimal():
+                fingerprint = int(fingerprint)
+            if isinstance(fingerprint, int):
+                max_fingerprint = fingerprint if max_fingerprint is None else max(max_fingerprint, fingerprint)
+            
+            m = data_dir_re.search(inst.get('user_data_dir', ''))
+            if m:
+                max_data_dir = max(max_data_dir, int(m.group(1)))
+        
+        # 没有任何数字指纹时从 1000 开始编号
+        if max_fingerprint is None:
+            max_fingerprint = 999
+        return max_instance + 1, max_data_dir + 1, max_fingerprint + 1
     
     @staticmethod
-    def get_default_instance_values(instances: List[Dict], ip_info: Dict, is_windows: bool) -> Dict:
-        """获取默认实例配置"""
-        instance_num = InstanceUtils.get_next_number(instances, 'name', 'Instance ')
-        data_dir_num = InstanceUtils.get_next_data_dir_number(instances, is_windows)
-        fingerprint_num = InstanceUtils.get_next_number(instances, 'fingerprint', '', 1000)
+    def get_default_instance_values(instances: List[Dict], ip_info: Dict, is_windows: bool,
+                                    next_numbers: Optional[Tuple[int, int, int]] = None) -> Dict:
+        """获取默认实例配置，调用方已算好下一个编号时可通过 next_numbers 传入"""
+        if next_numbers is None:
+            next_numbers = InstanceUtils.get_next_numbers(instances, is_windows)
+        instance_num, data_dir_num, fingerprint_num = next_numbers
         
         timezone = ip_info.get('timezone', 'Asia/Shanghai')
         
@@ -469,9 +1120,64 @@ class InstanceUtils:
             "speaker_protection": "开启"
         }
 
+class LazyComboBox(QComboBox):
+    """首次展开、获得焦点或滚动时才填充其余选项的下拉框，初始只包含默认的第一项"""
+    
+    def __init__(self, items: List[str], parent=None):
+        super().__init__(parent)
+        if items:
+            self.addItem(items[0])
+        self._pending = items[1:]
+        
+    def _populate(self):
+        if self._pending:
+            self.addItems(self._pending)
+            self._pending = []
+        
+    def showPopup(self):
+        self._populate()
+        super().showPopup()
+        
+    def focusInEvent(self, event):
+        # 方向键和按字母跳转在收起状态下也要能选到其余选项
+        self._populate()
+        super().focusInEvent(event)
+        
+    def keyPressEvent(self, event):
+        self._populate()
+        super().keyPressEvent(event)
+        
+    def wheelEvent(self, event):
+        # 滚轮不需要焦点即可切换选项
+        self._populate()
+        super().wheelEvent(event)
+
 class AddInstanceDialog(QDialog):
     """添加/编辑实例对话框"""
     
+    # 环境参数：(标签, 字段, 下拉选项（None 表示文本框）, 行, 列)，顺序即保存到配置中的字段顺序
+    ENV_FIELDS = (
+        ("分辨率", "resolution", None, 0, 0),
+        ("字体指纹", "font_fingerprint", None, 0, 2),
+        ("WebRTC", "webrtc", ("禁止", "允许"), 1, 0),
+        ("WebGL 图像", "webgl_image", ("随机", "自定义"), 1, 2),
+        ("WebGL Info", "webgl_info", ("自定义", "随机"), 2, 0),
+        ("Canvas", "canvas", ("随机", "自定义"), 2, 2),
+        ("AudioContext", "audiocontext", ("随机", "自定义"), 3, 0),
+        ("Speech Voices", "speech_voices", ("随机", "自定义"), 3, 2),
+        ("Do Not Track", "do_not_track", ("开启", "关闭"), 4, 0),
+        ("Client Rects", "client_rects", ("随机", "自定义"), 4, 2),
+        ("媒体设备", "media_devices", ("随机", "自定义"), 5, 0),
+        ("设备名称", "device_name", None, 5, 2),
+        ("MAC地址", "mac_address", None, 6, 0),
+        ("硬件并发数", "hardware_concurrency", None, 6, 2),
+        ("设备内存(G)", "device_memory", None, 7, 0),
+        ("SSL指纹设置", "ssl_fingerprint", ("关闭", "开启"), 7, 2),
+        ("喇叭扫描保护", "speaker_protection", ("开启", "关闭"), 8, 0),
+    )
+    # 需要保存为整数的环境参数
+    INT_ENV_FIELDS = ("hardware_concurrency", "device_memory")
+    
     def __init__(self, parent, default_values: Optional[Dict] = None):
         super().__init__(parent)
         self.setWindowTitle("添加新实例")
@@ -503,11 +1209,11 @@ class AddInstanceDialog(QDialog):
         self.proxy_server_edit = QLineEdit(self.default_values["proxy_server"])
         
         # 版本选择
-        self.version_combo = QComboBox()
         # self.version_combo.addItem("默认版本")
+        tags = []
         if self.parent and hasattr(self.parent, 'available_versions'):
-            for version in self.parent.available_versions:
-                self.version_combo.addItem(version['tag_name'])
+            tags = [version['tag_name'] for version in self.parent.available_versions]
+        self.version_combo = LazyComboBox(tags)
         
         base_form.addRow("名称:", self.name_edit)
         base_form.addRow("Fingerprint:", self.fingerprint_edit)
@@ -523,59 +1229,17 @@ class AddInstanceDialog(QDialog):
         env_group.setCheckable(True)
         env_group.setChecked(False)  # 默认折叠
         env_grid = QGridLayout()
-        # 左列参数
-        env_grid.addWidget(QLabel("分辨率:"), 0, 0)
-        self.resolution_edit = QLineEdit(self.default_values["resolution"])
-        env_grid.addWidget(self.resolution_edit, 0, 1)
-        env_grid.addWidget(QLabel("WebRTC:"), 1, 0)
-        self.webrtc_combo = QComboBox(); self.webrtc_combo.addItems(["禁止", "允许"]); self.webrtc_combo.setCurrentText(self.default_values["webrtc"])
-        env_grid.addWidget(self.webrtc_combo, 1, 1)
-        env_grid.addWidget(QLabel("WebGL Info:"), 2, 0)
-        self.webgl_info_combo = QComboBox(); self.webgl_info_combo.addItems(["自定义", "随机"]); self.webgl_info_combo.setCurrentText(self.default_values["webgl_info"])
-        env_grid.addWidget(self.webgl_info_combo, 2, 1)
-        env_grid.addWidget(QLabel("AudioContext:"), 3, 0)
-        self.audiocontext_combo = QComboBox(); self.audiocontext_combo.addItems(["随机", "自定义"]); self.audiocontext_combo.setCurrentText(self.default_values["audiocontext"])
-        env_grid.addWidget(self.audiocontext_combo, 3, 1)
-        env_grid.addWidget(QLabel("Do Not Track:"), 4, 0)
-        self.do_not_track_combo = QComboBox(); self.do_not_track_combo.addItems(["开启", "关闭"]); self.do_not_track_combo.setCurrentText(self.default_values["do_not_track"])
-        env_grid.addWidget(self.do_not_track_combo, 4, 1)
-        env_grid.addWidget(QLabel("媒体设备:"), 5, 0)
-        self.media_devices_combo = QComboBox(); self.media_devices_combo.addItems(["随机", "自定义"]); self.media_devices_combo.setCurrentText(self.default_values["media_devices"])
-        env_grid.addWidget(self.media_devices_combo, 5, 1)
-        env_grid.addWidget(QLabel("MAC地址:"), 6, 0)
-        self.mac_address_edit = QLineEdit(self.default_values["mac_address"])
-        env_grid.addWidget(self.mac_address_edit, 6, 1)
-        env_grid.addWidget(QLabel("设备内存(G):"), 7, 0)
-        self.device_memory_edit = QLineEdit(str(self.default_values["device_memory"]))
-        env_grid.addWidget(self.device_memory_edit, 7, 1)
-        env_grid.addWidget(QLabel("喇叭扫描保护:"), 8, 0)
-        self.speaker_protection_combo = QComboBox(); self.speaker_protection_combo.addItems(["开启", "关闭"]); self.speaker_protection_combo.setCurrentText(self.default_values["speaker_protection"])
-        env_grid.addWidget(self.speaker_protection_combo, 8, 1)
-        # 右列参数
-        env_grid.addWidget(QLabel("字体指纹:"), 0, 2)
-        self.font_fingerprint_edit = QLineEdit(self.default_values["font_fingerprint"])
-        env_grid.addWidget(self.font_fingerprint_edit, 0, 3)
-        env_grid.addWidget(QLabel("WebGL 图像:"), 1, 2)
-        self.webgl_image_combo = QComboBox(); self.webgl_image_combo.addItems(["随机", "自定义"]); self.webgl_image_combo.setCurrentText(self.default_values["webgl_image"])
-        env_grid.addWidget(self.webgl_image_combo, 1, 3)
-        env_grid.addWidget(QLabel("Canvas:"), 2, 2)
-        self.canvas_combo = QComboBox(); self.canvas_combo.addItems(["随机", "自定义"]); self.canvas_combo.setCurrentText(self.default_values["canvas"])
-        env_grid.addWidget(self.canvas_combo, 2, 3)
-        env_grid.addWidget(QLabel("Speech Voices:"), 3, 2)
-        self.speech_voices_combo = QComboBox(); self.speech_voices_combo.addItems(["随机", "自定义"]); self.speech_voices_combo.setCurrentText(self.default_values["speech_voices"])
-        env_grid.addWidget(self.speech_voices_combo, 3, 3)
-        env_grid.addWidget(QLabel("Client Rects:"), 4, 2)
-        self.client_rects_combo = QComboBox(); self.client_rects_combo.addItems(["随机", "自定义"]); self.client_rects_combo.setCurrentText(self.default_values["client_rects"])
-        env_grid.addWidget(self.client_rects_combo, 4, 3)
-        env_grid.addWidget(QLabel("设备名称:"), 5, 2)
-        self.device_name_edit = QLineEdit(self.default_values["device_name"])
-        env_grid.addWidget(self.device_name_edit, 5, 3)
-        env_grid.addWidget(QLabel("硬件并发数:"), 6, 2)
-        self.hardware_concurrency_edit = QLineEdit(str(self.default_values["hardware_concurrency"]))
-        env_grid.addWidget(self.hardware_concurrency_edit, 6, 3)
-        env_grid.addWidget(QLabel("SSL指纹设置:"), 7, 2)
-        self.ssl_fingerprint_combo = QComboBox(); self.ssl_fingerprint_combo.addItems(["关闭", "开启"]); self.ssl_fingerprint_combo.setCurrentText(self.default_values["ssl_fingerprint"])
-        env_grid.addWidget(self.ssl_fingerprint_combo, 7, 3)
+        self._env_widgets: Dict[str, Union[QLineEdit, QComboBox]] = {}
+        for label, key, choices, row, column in self.ENV_FIELDS:
+            if choices:
+                widget = QComboBox()
+                widget.addItems(choices)
+                widget.setCurrentText(self.default_values[key])
+            else:
+                widget = QLineEdit(str(self.default_values[key]))
+            env_grid.addWidget(QLabel(f"{label}:"), row, column)
+            env_grid.addWidget(widget, row, column + 1)
+            self._env_widgets[key] = widget
         # 设置layout
         env_group.setLayout(env_grid)
         layout.addWidget(env_group)
@@ -604,8 +1268,8 @@ class AddInstanceDialog(QDialog):
             return
         # 数字校验
         try:
-            int(self.hardware_concurrency_edit.text())
-            int(self.device_memory_edit.text())
+            for key in self.INT_ENV_FIELDS:
+                int(self._env_widgets[key].text())
         except ValueError:
             QMessageBox.warning(self, "提示", "硬件并发数和设备内存必须为数字！")
             return
@@ -615,11 +1279,7 @@ class AddInstanceDialog(QDialog):
             reply = QMessageBox.question(self, "版本未下载", f"所选版本 {version} 尚未下载，是否立即下载？", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
             if reply == QMessageBox.StandardButton.Yes:
                 # 查找版本信息
-                version_info = None
-                for v in self.parent.available_versions:
-                    if v['tag_name'] == version:
-                        version_info = v
-                        break
+                version_info = self.parent.get_version_info(version)
                 if version_info:
                     ok = self.parent.download_version(version_info)
                     if not ok:
@@ -633,31 +1293,19 @@ class AddInstanceDialog(QDialog):
         self.accept()
 
     def get_instance_data(self):
-        return {
+        data = {
             "name": self.name_edit.text(),
             "fingerprint": self.fingerprint_edit.text(),
             "user_data_dir": self.user_data_dir_edit.text(),
             "timezone": self.timezone_edit.text(),
             "proxy_server": self.proxy_server_edit.text(),
             "chromium_version": self.version_combo.currentText(),
-            "resolution": self.resolution_edit.text(),
-            "font_fingerprint": self.font_fingerprint_edit.text(),
-            "webrtc": self.webrtc_combo.currentText(),
-            "webgl_image": self.webgl_image_combo.currentText(),
-            "webgl_info": self.webgl_info_combo.currentText(),
-            "canvas": self.canvas_combo.currentText(),
-            "audiocontext": self.audiocontext_combo.currentText(),
-            "speech_voices": self.speech_voices_combo.currentText(),
-            "do_not_track": self.do_not_track_combo.currentText(),
-            "client_rects": self.client_rects_combo.currentText(),
-            "media_devices": self.media_devices_combo.currentText(),
-            "device_name": self.device_name_edit.text(),
-            "mac_address": self.mac_address_edit.text(),
-            "hardware_concurrency": int(self.hardware_concurrency_edit.text()),
-            "device_memory": int(self.device_memory_edit.text()),
-            "ssl_fingerprint": self.ssl_fingerprint_combo.currentText(),
-            "speaker_protection": self.speaker_protection_combo.currentText()
         }
+        for key, widget in self._env_widgets.items():
+            data[key] = widget.currentText() if isinstance(widget, QComboBox) else widget.text()
+        for key in self.INT_ENV_FIELDS:
+            data[key] = int(data[key])
+        return data
 
 class VerifyFingerprintDialog(QDialog):
     """指纹验证对话框"""
@@ -733,7 +1381,9 @@ class VerifyFingerprintDialog(QDialog):
                 cmd.extend([f"--proxy-server={self.instance['proxy_server']}"])
             cmd.append(site_url)
             
-            subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            # 新会话启动，与管理器的终端信号隔离（Windows 上忽略该参数）
+            subprocess.Popen(cmd, stdout=DEVNULL, stderr=DEVNULL,
+                             close_fds=True, start_new_session=True)
             logger.info(f"打开验证网站: {site_url}")
             
         except Exception as e:
@@ -742,6 +1392,10 @@ class VerifyFingerprintDialog(QDialog):
 
 class ChromiumManager(QMainWindow):
     """Chromium多实例管理器主窗口"""
+    # 后台启动完成后通知UI线程：实例名称、进程对象（失败时为 None）、错误信息
+    instance_launched = pyqtSignal(str, object, str)
+    # 后台轮转完成的 stderr 日志所属实例
+    stderr_logs_rotated = pyqtSignal(list)
     
     def __init__(self):
         super().__init__()
@@ -753,23 +1407,57 @@ class ChromiumManager(QMainWindow):
         
         # 初始化数据
         self.running_instances: Dict[str, int] = {}
-        self.checkbox_states: Dict[str, bool] = {}
+        self._processes: Dict[str, subprocess.Popen] = {}
+        # 实例 -> stderr 日志中已报告过的位置，退出时只报告之后新增的输出
+        self._stderr_offsets: Dict[str, int] = {}
+        # 本轮事件中退出、等待统一报告 stderr 的实例
+        self._exited_pending: List[str] = []
+        self._idle_ticks = 0
+        
+        # 批量启动使用的线程池
+        self._launch_pool = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4))
+        self._batch_pending = 0
+        self._batch_success = 0
+        self._batch_failed: List[str] = []
+        self._batch_launched: List[str] = []
+        # 批量启动中结果尚未在UI线程处理的任务，关闭窗口时用于取消未开始的任务并结束已启动的进程
+        self._launch_futures: Dict[str, Future] = {}
+        self.instance_launched.connect(self._on_instance_launched)
+        self._stderr_rotating = False
+        self.stderr_logs_rotated.connect(self._on_stderr_logs_rotated)
+        # 表格行缓存：每行对应的实例对象（按对象身份而非名称区分，允许重名）及勾选单元格，用于增量更新
+        self._row_instances: List[Dict] = []
+        self._row_checkboxes: List[QTableWidgetItem] = []
         self.config: Dict = {'instances': []}
+        self._config_dirty = False
+        self._save_suspended = 0
+        self._next_ids: Optional[Tuple[int, int, int]] = None
         self.available_versions: List[Dict] = []
+        self._versions_by_tag: Dict[str, Dict] = {}
+        self.ip_info: Dict = {}
+        self._ip_fetched = False
+        self._ip_thread: Optional[FetchThread] = None
+        self._versions_thread: Optional[FetchThread] = None
+        self.timer: Optional[QTimer] = None
         
         # 检测操作系统
         self.system = platform.system().lower()
         self.is_windows = self.system == 'windows'
         self.is_macos = self.system == 'darwin'
         
-        # 异步初始化
-        self._init_async_data()
+        # 配置延迟保存定时器，短时间内的多次修改只写一次文件
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(Constants.CONFIG_SAVE_DELAY)
+        self._save_timer.timeout.connect(self._flush_config)
         
         # 加载配置和设置UI
         self.load_config()
-        self.fetch_available_versions()
         self.setup_ui()
         
+        # 异步初始化，网络数据返回后再刷新界面
+        self._init_async_data()
+        
         # 设置定时器更新进程状态
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_process_status)
@@ -781,30 +1469,70 @@ class ChromiumManager(QMainWindow):
         """初始化路径"""
         script_dir = os.path.dirname(os.path.abspath(__file__))
         self.config_file = os.path.join(script_dir, "config.yaml")
+        self.config_cache_file = os.path.join(script_dir, ".config.pkl")
         self.app_dir = os.path.join(script_dir, "App")
         self.download_dir = os.path.join(script_dir, "DownLoad")
+        self.cache_dir = os.path.join(script_dir, ".cache")
+        self.stderr_dir = os.path.join(self.cache_dir, "stderr")
         self.platform_dir = os.path.join(
             self.app_dir, 
             "win_x64" if platform.system().lower() == 'windows' else "macos"
         )
         
-        # 确保目录存在
-        for directory in [self.app_dir, self.download_dir, self.platform_dir]:
-            os.makedirs(directory, exist_ok=True)
+        # 确保目录存在（platform_dir 位于 app_dir 下、stderr_dir 位于 cache_dir 下，创建时会一并创建父目录）
+        for directory in (self.platform_dir, self.download_dir, self.stderr_dir):
+            if not os.path.isdir(directory):
+                os.makedirs(directory, exist_ok=True)
+        
+        # 版本目录下可执行文件的候选相对路径，按平台只计算一次
+        if platform.system().lower() == 'windows':
+            self._exe_candidates: Tuple[Tuple[str, ...], ...] = (
+                ('chrome.exe',),
+                ('Chromium', 'chrome.exe'),
+                ('chrome-win', 'chrome.exe'),
+            )
+        else:
+            self._exe_candidates = (
+                ('Chromium.app', 'Contents', 'MacOS', 'Chromium'),
+                ('Chromium', 'Contents', 'MacOS', 'Chromium'),
+            )
+        # 版本 -> (检查时间, 可执行文件路径或 None)，供 has_version 短时间复用
+        self._has_version_cache: Dict[str, Tuple[float, Optional[str]]] = {}
+        # 版本 -> ((可执行文件路径, stat 结果) 或 None, 版本目录的 (st_ino, st_mtime_ns))
+        self._chromium_path_cache: Dict[str, Tuple[Optional[Tuple[str, os.stat_result]], Tuple[int, int]]] = {}
     
     def _init_async_data(self):
         """异步初始化数据"""
-        self.ip_info = self.fetch_ip_info()
+        self._ip_thread = FetchThread(self.fetch_ip_info)
+        self._ip_thread.result.connect(self._on_ip_info_fetched)
+        self._ip_thread.start()
+        
+        # 先用本地缓存的版本列表，后台再校验是否有更新
+        cached = HttpCache.peek(Constants.GITHUB_RELEASES_URL, self.cache_dir)
+        if cached:
+            try:
+                self._set_available_versions(self._parse_releases(cached))
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning(f"版本缓存解析失败: {e}")
+        self.fetch_available_versions()
+    
+    def _on_ip_info_fetched(self, ip_info: Dict):
+        """IP信息获取完成"""
+        self.ip_info = ip_info
+        self._ip_fetched = True
+        self.ip_label.setText(self.format_ip_info())
 
     def fetch_ip_info(self) -> Dict:
         """获取IP信息"""
         try:
             logger.info("正在获取IP信息...")
-            resp = requests.get(Constants.IP_INFO_URL, timeout=Constants.IP_INFO_TIMEOUT)
-            if resp.status_code == 200:
-                ip_info = resp.json()
-                logger.info(f"IP信息获取成功: {ip_info.get('ip', 'Unknown')}")
-                return ip_info
+            # 过期的IP和时区会被当作当前信息显示，网络出错时不使用旧缓存
+            body, _ = HttpCache.get(Constants.IP_INFO_URL, self.cache_dir,
+                                    Constants.IP_INFO_CACHE_MAX_AGE, Constants.IP_INFO_TIMEOUT,
+                                    stale_on_error=False)
+            ip_info = json_loads(body)
+            logger.info(f"IP信息获取成功: {ip_info.get('ip', 'Unknown')}")
+            return ip_info
         except requests.exceptions.RequestException as e:
             logger.warning(f"网络错误，无法获取IP信息: {e}")
         except Exception as e:
@@ -812,84 +1540,152 @@ class ChromiumManager(QMainWindow):
         return {}
 
     def fetch_available_versions(self):
-        """从 GitHub 获取可用的 Chromium 版本"""
+        """在后台线程中获取可用版本"""
+        if self._versions_thread and self._versions_thread.isRunning():
+            return
+        self._versions_thread = FetchThread(self._load_available_versions)
+        self._versions_thread.result.connect(self._on_versions_fetched)
+        self._versions_thread.start()
+    
+    def _on_versions_fetched(self, versions: Optional[List[Dict]]):
+        """版本列表获取完成，获取失败时保留原有列表"""
+        if versions is not None:
+            self._set_available_versions(versions)
+
+    def _set_available_versions(self, versions: List[Dict]):
+        """更新可用版本列表，并重建按标签查找的索引"""
+        self.available_versions = versions
+        self._versions_by_tag = {v['tag_name']: v for v in versions}
+
+    def get_version_info(self, tag: str) -> Optional[Dict]:
+        """按版本标签查找下载信息"""
+        return self._versions_by_tag.get(tag)
+
+    def _load_available_versions(self) -> Optional[List[Dict]]:
+        """从 GitHub 获取可用的 Chromium 版本，内容未变化时返回 None"""
         try:
             logger.info("正在获取可用版本...")
-            response = requests.get(Constants.GITHUB_RELEASES_URL, timeout=Constants.VERSION_FETCH_TIMEOUT)
-            response.raise_for_status()
-            
-            releases = response.json()
-            self.available_versions = []
-            
-            for release in releases:
-                for asset in release['assets']:
-                    asset_name = asset['name'].lower()
-                    # 根据系统筛选合适的文件
-                    if ((self.is_windows and 'windows' in asset_name and asset_name.endswith('.zip')) or
-                        (self.is_macos and 'macos' in asset_name and asset_name.endswith('.dmg'))):
-                        
-                        self.available_versions.append({
-                            'tag_name': release['tag_name'],
-                            'name': asset['name'],
-                            'download_url': asset['browser_download_url'],
-                            'size': round(asset['size'] / (1024 * 1024), 1),  # MB
-                            'published_at': release['published_at'][:10],
-                            'filepath': os.path.join(self.download_dir, asset['name'])
-                        })
-            
-            # 按发布日期排序，最新的在前面
-            self.available_versions.sort(key=lambda x: x['published_at'], reverse=True)
-            
-            logger.info(f"找到 {len(self.available_versions)} 个可用版本")
-            for version in self.available_versions:
-                logger.debug(f"- {version['tag_name']}: {version['name']}")
+            body, changed = HttpCache.get(Constants.GITHUB_RELEASES_URL, self.cache_dir,
+                                          Constants.RELEASES_CACHE_MAX_AGE, Constants.VERSION_FETCH_TIMEOUT)
+            if not changed and self.available_versions:
+                logger.info("版本信息未变化，使用缓存")
+                return None
+            return self._parse_releases(body)
                     
         except requests.exceptions.RequestException as e:
             logger.error(f"网络错误，无法获取版本信息: {e}")
-        except Exception as e:
-            logger.error(f"获取版本信息失败: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("获取版本信息失败")
+        return None
+    
+    def _parse_releases(self, body: str) -> List[Dict]:
+        """解析 GitHub releases 数据，筛选出当前平台的安装包"""
+        releases = json_loads(body)
+        
+        # 根据系统确定安装包的关键字和扩展名
+        if self.is_windows:
+            keyword, suffix = 'windows', '.zip'
+        elif self.is_macos:
+            keyword, suffix = 'macos', '.dmg'
+        else:
+            return []
+        download_dir = self.download_dir
+        
+        available_versions = []
+        for release in releases:
+            tag_name = release['tag_name']
+            published_at = release['published_at'][:10]
+            for asset in release['assets']:
+                asset_name = asset['name']
+                lower_name = asset_name.lower()
+                if keyword not in lower_name or not lower_name.endswith(suffix):
+                    continue
+                available_versions.append({
+                    'tag_name': tag_name,
+                    'name': asset_name,
+                    'download_url': asset['browser_download_url'],
+                    'size': round(asset['size'] / (1024 * 1024), 1),  # MB
+                    'published_at': published_at,
+                    'filepath': os.path.join(download_dir, asset_name)
+                })
+        
+        # 按发布日期排序，最新的在前面
+        available_versions.sort(key=itemgetter('published_at'), reverse=True)
+        
+        logger.info(f"找到 {len(available_versions)} 个可用版本")
+        for version in available_versions:
+            logger.debug(f"- {version['tag_name']}: {version['name']}")
+        return available_versions
 
     def get_chromium_path(self, version: str = "default") -> Optional[str]:
         """根据版本获取 Chromium 可执行文件路径"""
-        # 首先从配置文件中查找
-        if (self.config.get('versions', {}).get(version, {}).get('path')):
-            config_path = self.config['versions'][version]['path']
-            if os.path.exists(config_path):
-                return config_path
+        path = self._resolve_version_path(version)
+        if path is None:
+            logger.warning(f"未找到版本 {version} 的可执行文件")
+        return path
+
+    def _resolve_version_path(self, version: str) -> Optional[str]:
+        """查找版本的可执行文件路径，get_chromium_path 和 has_version 共用"""
+        # 首先检查配置中的路径
+        config_path = self.config.get('versions', {}).get(version, {}).get('path')
+        if config_path and FileExtractor.stat_file(config_path):
+            return config_path
         
-        # 如果配置文件中没有或路径不存在，则动态查找
+        # 配置中没有或路径不存在时动态查找版本目录
+        found = self._find_chromium_exe(version)
+        if found is None:
+            return None
+        path, st = found
+        # 更新配置，复用查找时得到的 stat 结果
+        self.update_version_config(version, path, st)
+        return path
+
+    def _find_chromium_exe(self, version: str) -> Optional[Tuple[str, os.stat_result]]:
+        """在版本目录中查找可执行文件，返回 (路径, stat 结果)，结果按版本目录的 inode 和修改时间缓存"""
         version_dir = os.path.join(self.platform_dir, version)
-        if not os.path.exists(version_dir):
+        try:
+            st = os.stat(version_dir)
+        except OSError:
+            self._chromium_path_cache.pop(version, None)
             return None
-            
-        # 根据平台查找可执行文件
-        if self.is_windows:
-            possible_paths = [
-                os.path.join(version_dir, 'chrome.exe'),
-                os.path.join(version_dir, 'Chromium', 'chrome.exe'),
-                os.path.join(version_dir, 'chrome-win', 'chrome.exe')
-            ]
-        else:  # macOS
-            possible_paths = [
-                os.path.join(version_dir, 'Chromium.app', 'Contents', 'MacOS', 'Chromium'),
-                os.path.join(version_dir, 'Chromium', 'Contents', 'MacOS', 'Chromium')
-            ]
-            
-        for path in possible_paths:
-            if os.path.exists(path):
-                # 更新配置文件
-                self.update_version_config(version, path)
-                return path
-                
-        logger.warning(f"未找到版本 {version} 的可执行文件")
+        stamp = (st.st_ino, st.st_mtime_ns)
+        
+        cached = self._chromium_path_cache.get(version)
+        if cached and cached[1] == stamp:
+            return cached[0]
+        
+        # 列一次目录；首级候选先用目录项自带的类型信息筛选，命中后只 stat 一次
+        try:
+            with os.scandir(version_dir) as it:
+                entries = {entry.name: entry for entry in it}
+        except OSError:
+            return None
+        
+        for parts in self._exe_candidates:
+            entry = entries.get(parts[0])
+            if entry is None:
+                continue
+            if len(parts) == 1:
+                path = entry.path
+                exe_st = FileExtractor.stat_file(path) if entry.is_file() else None
+            else:
+                path = os.path.join(version_dir, *parts)
+                exe_st = FileExtractor.stat_file(path) if entry.is_dir() else None
+            if exe_st is not None:
+                found = (path, exe_st)
+                self._chromium_path_cache[version] = (found, stamp)
+                return found
+        
+        # 未找到也按目录状态缓存，目录内容变化后自动失效
+        self._chromium_path_cache[version] = (None, stamp)
         return None
 
     def download_version(self, version_info: Dict) -> bool:
         """下载指定版本的 Chromium"""
         dialog = DownloadDialog(self, version_info)
-        if dialog.exec():
+        accepted = dialog.exec()
+        self.invalidate_version_cache(version_info['tag_name'])
+        if accepted:
             # 下载完成后刷新版本列表
             self.fetch_available_versions()
             return True
@@ -899,24 +1695,21 @@ class ChromiumManager(QMainWindow):
         """加载配置文件"""
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    loaded_config = yaml.safe_load(f)
-                    if loaded_config:
-                        self.config = loaded_config
+                loaded_config = self._read_config_cache()
+                if loaded_config is None:
+                    with open(self.config_file, 'r', encoding='utf-8') as f:
+                        loaded_config = yaml.load(f, Loader=YamlLoader)
+                    if isinstance(loaded_config, dict):
+                        self._fill_instance_defaults(loaded_config)
+                    self._write_config_cache(loaded_config)
+                if loaded_config:
+                    self.config = loaded_config
             
             # 确保配置结构完整
             if 'instances' not in self.config:
                 self.config['instances'] = []
             if 'versions' not in self.config:
                 self.config['versions'] = {}
-                
-            # 配置兼容性：补全每个实例缺失字段
-            if self.config['instances']:
-                default_fields = InstanceUtils.get_default_instance_values([], {}, self.is_windows)
-                for inst in self.config['instances']:
-                    for k, v in default_fields.items():
-                        if k not in inst:
-                            inst[k] = v
             
             logger.info(f"配置加载成功，共有 {len(self.config['instances'])} 个实例")
             
@@ -927,6 +1720,43 @@ class ChromiumManager(QMainWindow):
             logger.error(f"加载配置失败: {e}")
             self._create_default_config()
 
+    def _fill_instance_defaults(self, config: Dict):
+        """配置兼容性：补全每个实例缺失字段，结果随解析缓存一起保存，缓存命中时无需再做"""
+        instances = config.get('instances')
+        if not instances:
+            return
+        default_fields = InstanceUtils.get_default_instance_values([], {}, self.is_windows)
+        field_names = default_fields.keys()
+        if all(field_names <= inst.keys() for inst in instances):
+            return
+        config['instances'] = [{**default_fields, **inst} for inst in instances]
+
+    def _config_cache_schema(self) -> Tuple[str, ...]:
+        """实例默认字段列表，新版本增加字段后旧的解析缓存随之失效，重新补全默认值"""
+        return tuple(InstanceUtils.get_default_instance_values([], {}, self.is_windows))
+
+    def _read_config_cache(self) -> Optional[Dict]:
+        """读取已解析配置的缓存，配置文件的修改时间、大小和实例字段列表都不变时才有效"""
+        try:
+            st = os.stat(self.config_file)
+            with open(self.config_cache_file, 'rb') as f:
+                mtime_ns, size, schema, config = pickle.load(f)
+        except (OSError, pickle.PickleError, ValueError, EOFError):
+            return None
+        if (mtime_ns, size, schema) != (st.st_mtime_ns, st.st_size, self._config_cache_schema()):
+            return None
+        return config
+    
+    def _write_config_cache(self, config: Optional[Dict]):
+        """以配置文件当前的修改时间、大小和实例字段列表为键缓存解析结果"""
+        try:
+            st = os.stat(self.config_file)
+            with open(self.config_cache_file, 'wb') as f:
+                pickle.dump((st.st_mtime_ns, st.st_size, self._config_cache_schema(), config), f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+        except (OSError, pickle.PickleError) as e:
+            logger.warning(f"写入配置缓存失败: {e}")
+
     def _create_default_config(self):
         """创建默认配置"""
         self.config = {
@@ -938,13 +1768,42 @@ class ChromiumManager(QMainWindow):
     def save_config(self):
         """保存配置文件"""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                yaml.dump(self.config, f, default_flow_style=False, allow_unicode=True)
+            self._write_config_file(self._serialize_config())
+            self._config_dirty = False
             logger.debug("配置文件保存成功")
         except Exception as e:
             logger.error(f"保存配置失败: {e}")
             QMessageBox.critical(self, "错误", f"保存配置失败: {str(e)}")
 
+    def _serialize_config(self) -> str:
+        """将配置序列化为YAML文本"""
+        return yaml.dump(self.config, Dumper=YamlDumper, default_flow_style=False,
+                         allow_unicode=True, sort_keys=False)
+
+    def _write_config_file(self, data: str):
+        """写入配置文件（先写临时文件再原子替换，避免写入中断导致配置损坏），不涉及UI，可在后台线程调用"""
+        tmp_file = self.config_file + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.config_file)
+        self._write_config_cache(self.config)
+
+    def _save_config_in_background(self):
+        """关闭时使用：在UI线程序列化，文件写入交给非守护线程，进程退出前会等待其完成"""
+        data = self._serialize_config()
+        self._config_dirty = False
+
+        def write():
+            try:
+                self._write_config_file(data)
+                logger.debug("配置文件保存成功")
+            except Exception as e:
+                logger.error(f"保存配置失败: {e}")
+
+        threading.Thread(target=write, daemon=False).start()
+
     def setup_ui(self):
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -952,9 +1811,9 @@ class ChromiumManager(QMainWindow):
         left_layout = QVBoxLayout()
         right_layout = QVBoxLayout()
         # 顶部 IP 信息
-        ip_label = QLabel(self.format_ip_info())
-        ip_label.setWordWrap(True)
-        left_layout.addWidget(ip_label)
+        self.ip_label = QLabel(self.format_ip_info())
+        self.ip_label.setWordWrap(True)
+        left_layout.addWidget(self.ip_label)
         # 按钮区域
         button_layout = QHBoxLayout()
         add_btn = QPushButton("添加实例")
@@ -984,6 +1843,9 @@ class ChromiumManager(QMainWindow):
 
         # 实例列表
         self.table = QTableWidget()
+        # 选中行变化时刷新环境参数区（只连接一次）
+        self._env_info_pending = False
+        self.table.currentCellChanged.connect(self._schedule_env_info_update)
         self.table.setColumnCount(8)  # 增加一列显示版本
         self.table.setHorizontalHeaderLabels(["选择", "名称", "Fingerprint", "用户数据目录", "时区", "代理服务器", "版本", "状态"])
         
@@ -1025,7 +1887,10 @@ class ChromiumManager(QMainWindow):
     def show_download_dialog(self):
         """显示版本下载对话框"""
         if not self.available_versions:
-            QMessageBox.warning(self, "警告", "无法获取版本信息，请检查网络连接")
+            if self._versions_thread and self._versions_thread.isRunning():
+                QMessageBox.information(self, "提示", "正在获取版本信息，请稍候")
+            else:
+                QMessageBox.warning(self, "警告", "无法获取版本信息，请检查网络连接")
             return
         
         # 创建版本选择对话框
@@ -1086,74 +1951,94 @@ class ChromiumManager(QMainWindow):
 
     def format_ip_info(self):
         info = self.ip_info
+        if not self._ip_fetched:
+            return "正在获取IP/地理信息..."
         if not info:
             return "IP/地理信息获取失败"
-        return f"IP: {info.get('ip', '')}\n国家: {info.get('country_long', '')}\n城市: {info.get('city', '')}\n时区: {info.get('timezone', '')}"
+        return Constants.IP_INFO_TEMPLATE.format_map(defaultdict(str, info))
 
     def update_table(self):
-        # 保存当前复选框状态
-        self.save_checkbox_states()
-        self.table.setRowCount(len(self.config['instances']))
-        for i, instance in enumerate(self.config['instances']):
-            # 添加复选框
-            checkbox = QCheckBox()
-            checkbox_widget = QWidget()
-            checkbox_layout = QHBoxLayout(checkbox_widget)
-            checkbox_layout.addWidget(checkbox)
-            checkbox_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            checkbox_layout.setContentsMargins(0, 0, 0, 0)
-            
-            # 恢复复选框状态
-            if instance['name'] in self.checkbox_states:
-                checkbox.setChecked(self.checkbox_states[instance['name']])
+        """按实例对象增量同步表格，只创建新增的行、只修改内容变化的单元格"""
+        instances = self.config['instances']
+        # 行缓存持有实例对象的引用，id 在比较期间不会被复用
+        alive = {id(instance) for instance in instances}
+        
+        # 批量修改期间暂停重绘，结束后统一刷新一次
+        self.table.setUpdatesEnabled(False)
+        try:
+            # 删除已不存在的实例所在的行（从后往前，保证行号有效）
+            for row in range(len(self._row_instances) - 1, -1, -1):
+                if id(self._row_instances[row]) not in alive:
+                    self._remove_row(row)
             
-            self.table.setCellWidget(i, 0, checkbox_widget)
+            # 实例顺序只会因追加、删除、编辑（替换为新对象）而变化，逐行对齐即可
+            for i, instance in enumerate(instances):
+                name = instance['name']
+                if i >= len(self._row_instances) or self._row_instances[i] is not instance:
+                    self.table.insertRow(i)
+                    self._row_instances.insert(i, instance)
+                    self._create_row_check_item(i)
+                
+                self._set_cell_text(i, 1, name)
+                self._set_cell_text(i, 2, instance['fingerprint'])
+                self._set_cell_text(i, 3, instance['user_data_dir'])
+                self._set_cell_text(i, 4, instance['timezone'])
+                self._set_cell_text(i, 5, instance['proxy_server'])
+                self._set_cell_text(i, 6, instance.get('chromium_version', '默认版本'))
+                self._set_cell_text(i, 7, "运行中" if name in self.running_instances else "已停止")
             
-            # 添加其他列
-            self.table.setItem(i, 1, QTableWidgetItem(instance['name']))
-            self.table.setItem(i, 2, QTableWidgetItem(instance['fingerprint']))
-            self.table.setItem(i, 3, QTableWidgetItem(instance['user_data_dir']))
-            self.table.setItem(i, 4, QTableWidgetItem(instance['timezone']))
-            self.table.setItem(i, 5, QTableWidgetItem(instance['proxy_server']))
-            self.table.setItem(i, 6, QTableWidgetItem(instance.get('chromium_version', '默认版本')))
-            status = "运行中" if instance['name'] in self.running_instances else "已停止"
-            self.table.setItem(i, 7, QTableWidgetItem(status))
-
+            # 对齐后多出的行（例如实例顺序发生变化时）一并删除，保证行数与实例数一致
+            for row in range(len(self._row_instances) - 1, len(instances) - 1, -1):
+                self._remove_row(row)
+        finally:
+            self.table.setUpdatesEnabled(True)
+        
         # 更新环境参数区
         self.update_env_info()
-        # 强制保存配置，确保界面和文件同步
-        self.save_config()
-
-    def save_checkbox_states(self):
-        # 保存所有复选框的当前状态
-        for i in range(self.table.rowCount()):
-            checkbox_widget = self.table.cellWidget(i, 0)
-            if checkbox_widget:
-                checkbox = checkbox_widget.findChild(QCheckBox)
-                if checkbox:
-                    instance_name = self.table.item(i, 1).text()
-                    self.checkbox_states[instance_name] = checkbox.isChecked()
+        # 配置被修改过时延迟写入文件
+        self._schedule_config_save()
+    
+    def _create_row_check_item(self, row: int):
+        """为新行创建可勾选的单元格，勾选状态保存在表格模型中（Qt.CheckStateRole）"""
+        item = QTableWidgetItem()
+        item.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable)
+        item.setCheckState(Qt.CheckState.Unchecked)
+        self.table.setItem(row, 0, item)
+        self._row_checkboxes.insert(row, item)
+    
+    def _remove_row(self, row: int):
+        """删除表格行及其缓存"""
+        self.table.removeRow(row)
+        del self._row_instances[row]
+        del self._row_checkboxes[row]
+    
+    def _set_cell_text(self, row: int, column: int, text: str):
+        """仅在单元格内容变化时更新"""
+        item = self.table.item(row, column)
+        if item is None:
+            self.table.setItem(row, column, QTableWidgetItem(text))
+        elif item.text() != text:
+            item.setText(text)
+    
+    def refresh_statuses(self):
+        """只刷新状态列，用于进程启动/停止等不改变配置的场景"""
+        for i, instance in enumerate(self.config['instances']):
+            item = self.table.item(i, 7)
+            if item is None:
+                continue
+            status = "运行中" if instance['name'] in self.running_instances else "已停止"
+            if item.text() != status:
+                item.setText(status)
 
     def update_all_checkboxes(self, checked):
-        # 更新所有复选框状态并保存
-        for i in range(self.table.rowCount()):
-            checkbox_widget = self.table.cellWidget(i, 0)
-            if checkbox_widget:
-                checkbox = checkbox_widget.findChild(QCheckBox)
-                if checkbox:
-                    checkbox.setChecked(checked)
-                    instance_name = self.table.item(i, 1).text()
-                    self.checkbox_states[instance_name] = checked
+        # 更新所有复选框状态
+        state = Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
+        for item in self._row_checkboxes:
+            item.setCheckState(state)
 
     def get_selected_instances(self):
-        selected = []
-        for i in range(self.table.rowCount()):
-            checkbox_widget = self.table.cellWidget(i, 0)
-            if checkbox_widget:
-                checkbox = checkbox_widget.findChild(QCheckBox)
-                if checkbox and checkbox.isChecked():
-                    selected.append(self.config['instances'][i])
-        return selected
+        return [instance for instance, item in zip(self._row_instances, self._row_checkboxes)
+                if item.checkState() == Qt.CheckState.Checked]
 
     def add_instance(self):
         """添加新实例"""
@@ -1163,7 +2048,8 @@ class ChromiumManager(QMainWindow):
             last_instance = self.config['instances'][-1].copy()
             # 使用工具类生成新的默认值
             default_values = InstanceUtils.get_default_instance_values(
-                self.config['instances'], self.ip_info, self.is_windows
+                self.config['instances'], self.ip_info, self.is_windows,
+                self._compute_next_ids()
             )
             # 保留上一个实例的一些设置
             for key in ['timezone', 'proxy_server', 'chromium_version', 'resolution', 
@@ -1179,10 +2065,37 @@ class ChromiumManager(QMainWindow):
         if dialog.exec():
             instance_data = dialog.get_instance_data()
             self.config['instances'].append(instance_data)
-            self.save_config()
+            self._mark_instances_changed()
+            self._advance_next_ids(instance_data)
             self.update_table()
             logger.info(f"添加新实例: {instance_data['name']}")
 
+    def _compute_next_ids(self) -> Tuple[int, int, int]:
+        """下一个实例编号、数据目录编号和指纹编号，首次使用时遍历实例列表计算，之后增量维护"""
+        if self._next_ids is None:
+            self._next_ids = InstanceUtils.get_next_numbers(self.config['instances'], self.is_windows)
+        return self._next_ids
+
+    def _advance_next_ids(self, instance: Dict):
+        """添加或修改实例后只用该实例更新编号；删除实例时不回退，编号保持递增不复用"""
+        if self._next_ids is not None:
+            numbers = InstanceUtils.get_next_numbers([instance], self.is_windows)
+            self._next_ids = tuple(map(max, self._next_ids, numbers))
+
+    def _schedule_config_save(self):
+        """配置有未保存的修改时启动延迟保存定时器"""
+        if self._config_dirty and not self._save_timer.isActive():
+            self._save_timer.start()
+
+    def _flush_config(self):
+        """延迟保存定时器到期，写入未保存的配置"""
+        if self._config_dirty:
+            self.save_config()
+
+    def _mark_instances_changed(self):
+        """实例列表被修改：标记配置待保存"""
+        self._config_dirty = True
+
     def edit_instance(self):
         current_row = self.table.currentRow()
         if current_row < 0:
@@ -1195,7 +2108,8 @@ class ChromiumManager(QMainWindow):
         if dialog.exec():
             instance_data = dialog.get_instance_data()
             self.config['instances'][current_row] = instance_data
-            self.save_config()
+            self._mark_instances_changed()
+            self._advance_next_ids(instance_data)
             self.update_table()
 
     def delete_instance(self):
@@ -1216,20 +2130,29 @@ class ChromiumManager(QMainWindow):
             QMessageBox.StandardButton.No
         )
         if reply == QMessageBox.StandardButton.Yes:
-            # 从后往前删除，避免索引变化
-            for instance in sorted(selected, key=lambda x: self.config['instances'].index(x), reverse=True):
-                # 删除用户数据目录
-                user_data_dir = instance['user_data_dir']
-                if os.path.exists(user_data_dir):
-                    try:
-                        shutil.rmtree(user_data_dir)
-                    except Exception as e:
-                        QMessageBox.warning(self, "警告", f"删除用户数据目录失败：{str(e)}")
-                        continue
+            # 一次遍历建立索引，从后往前删除，避免索引变化
+            instances = self.config['instances']
+            index_map = {id(inst): i for i, inst in enumerate(instances)}
+            deleted = 0
+            failed = []
+            for i in sorted((index_map[id(inst)] for inst in selected), reverse=True):
+                # 删除用户数据目录：移走后由后台线程并行删除，界面不必等待
+                user_data_dir = instances[i]['user_data_dir']
+                try:
+                    FileExtractor.remove_dir_async(user_data_dir)
+                except Exception as e:
+                    failed.append(f"{instances[i]['name']}: {str(e)}")
+                    continue
                 # 从配置中删除实例
-                self.config['instances'].remove(instance)
+                del instances[i]
+                deleted += 1
+            if deleted:
+                self._mark_instances_changed()
             self.update_table()
-            QMessageBox.information(self, "成功", f"已成功删除 {len(selected)} 个实例")
+            if failed:
+                QMessageBox.warning(self, "警告", f"已删除 {deleted} 个实例\n删除用户数据目录失败：\n" + "\n".join(failed))
+            else:
+                QMessageBox.information(self, "成功", f"已成功删除 {deleted} 个实例")
 
     def start_selected_instance(self):
         selected = self.get_selected_instances()
@@ -1281,23 +2204,8 @@ class ChromiumManager(QMainWindow):
         
         try:
             logger.info(f"启动实例: {instance_name}")
-            logger.debug(f"启动命令: {' '.join(cmd)}")
-            
-            # 启动进程
-            process = subprocess.Popen(
-                cmd, 
-                stdout=subprocess.DEVNULL, 
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            
-            self.running_instances[instance_name] = process.pid
-            self.update_table()
-            
-            # 异步检查启动错误
-            self._check_process_errors(process, instance_name)
-            
-            logger.info(f"实例 {instance_name} 启动成功，PID: {process.pid}")
+            process = self._spawn_chromium(cmd, self._stderr_target(instance_name))
+            self._register_started_instance(instance_name, process)
 
         except FileNotFoundError:
             QMessageBox.critical(self, "错误", f"Chromium 可执行文件不存在: {chromium_path}")
@@ -1307,41 +2215,199 @@ class ChromiumManager(QMainWindow):
             logger.error(f"启动实例失败: {e}")
             QMessageBox.critical(self, "错误", f"启动失败: {str(e)}")
     
+    def _stderr_log_path(self, instance_name: str) -> str:
+        """实例 stderr 日志文件路径；替换特殊字符后不同名称可能相同，附加原名称的短哈希区分"""
+        digest = hashlib.sha1(instance_name.encode('utf-8')).hexdigest()[:8]
+        safe_name = re.sub(r'[^\w.-]', '_', instance_name)
+        return os.path.join(self.stderr_dir, f"{safe_name}-{digest}.log")
+
+    def _stderr_target(self, instance_name: str) -> Optional[str]:
+        """实例 stderr 的日志文件路径；Windows 上返回 None，stderr 直接丢弃
+
+        Windows 子进程继承的句柄没有追加语义，截断后仍从原位置写入，日志大小无法限制。
+        """
+        return None if self.is_windows else self._stderr_log_path(instance_name)
+
+    def _spawn_chromium(self, cmd: List[str], stderr_path: Optional[str]) -> subprocess.Popen:
+        """启动 Chromium 进程，不涉及任何UI操作，可在工作线程中调用
+
+        stderr 直接写入日志文件而不是管道，不需要为每个实例保留读取线程；stderr_path 为 None 时丢弃。
+        日志以追加模式打开，轮转时截断文件后进程从开头继续写入。
+        """
+        logger.debug(f"启动命令: {' '.join(cmd)}")
+        if stderr_path is None:
+            return subprocess.Popen(cmd, stdout=DEVNULL, stderr=DEVNULL,
+                                    close_fds=True, start_new_session=True)
+        with open(stderr_path, 'ab') as stderr_file:
+            stderr_file.truncate(0)
+            return subprocess.Popen(
+                cmd, 
+                stdout=DEVNULL, 
+                stderr=stderr_file,
+                close_fds=True,
+                start_new_session=True
+            )
+    
+    def _register_started_instance(self, instance_name: str, process: subprocess.Popen, refresh: bool = True):
+        """记录已启动的实例并刷新界面，必须在UI线程中调用；批量启动时由调用方在结束后统一刷新"""
+        self.running_instances[instance_name] = process.pid
+        self._processes[instance_name] = process
+        self._reset_status_timer()
+        if not self.is_windows:
+            self._stderr_offsets[instance_name] = 0
+        if refresh:
+            self.refresh_statuses()
+            # 异步检查启动错误；批量启动时在整批结束后统一检查
+            self._check_process_errors([instance_name])
+        
+        logger.info(f"实例 {instance_name} 启动成功，PID: {process.pid}")
+    
+    def _launch_worker(self, instance_name: str, cmd: List[str]) -> Optional[subprocess.Popen]:
+        """线程池中执行的启动任务，结果通过信号发回UI线程，同时作为任务结果返回"""
+        try:
+            process = self._spawn_chromium(cmd, self._stderr_target(instance_name))
+        except Exception as e:
+            self.instance_launched.emit(instance_name, None, str(e))
+            return None
+        self.instance_launched.emit(instance_name, process, "")
+        return process
+    
+    def _on_instance_launched(self, instance_name: str, process: Optional[subprocess.Popen], error: str):
+        """批量启动中单个实例启动完成"""
+        # 结果已处理，之后由 running_instances 跟踪该进程
+        self._launch_futures.pop(instance_name, None)
+        if process is not None:
+            self._register_started_instance(instance_name, process, refresh=False)
+            self._batch_success += 1
+            self._batch_launched.append(instance_name)
+        else:
+            self._batch_failed.append(f"{instance_name}: {error}")
+            logger.error(f"批量启动失败 {instance_name}: {error}")
+        
+        self._batch_pending -= 1
+        if self._batch_pending == 0:
+            self.refresh_statuses()
+            self._check_process_errors(self._batch_launched)
+            self._batch_launched = []
+            self._show_batch_start_result()
+    
+    def _show_batch_start_result(self):
+        """显示批量启动结果"""
+        if self._batch_failed:
+            QMessageBox.warning(
+                self, "批量启动结果", 
+                f"成功启动 {self._batch_success} 个实例\n失败的实例:\n" + "\n".join(self._batch_failed)
+            )
+        else:
+            QMessageBox.information(self, "成功", f"成功启动 {self._batch_success} 个实例")
+
     def _build_chromium_command(self, chromium_path: str, instance: Dict) -> List[str]:
         """构建Chromium启动命令"""
-        cmd = [chromium_path]
-        cmd.extend([f"--fingerprint={instance['fingerprint']}"])
-        cmd.extend([f"--user-data-dir={instance['user_data_dir']}"])
-        cmd.extend([f"--timezone={instance['timezone']}"])
+        cmd = [
+            chromium_path,
+            f"--fingerprint={instance['fingerprint']}",
+            f"--user-data-dir={instance['user_data_dir']}",
+            f"--timezone={instance['timezone']}",
+        ]
         
-        if instance.get('proxy_server'):
-            cmd.extend([f"--proxy-server={instance['proxy_server']}"])
+        proxy_server = instance.get('proxy_server')
+        if proxy_server:
+            cmd.append(f"--proxy-server={proxy_server}")
         
         # 添加其他启动参数
-        cmd.extend([
-            "--no-first-run",
-            "--disable-default-apps",
-            "--disable-background-mode"
-        ])
+        cmd += Constants.CHROMIUM_STATIC_ARGS
         
         return cmd
     
-    def _check_process_errors(self, process: subprocess.Popen, instance_name: str):
-        """异步检查进程错误"""
-        def read_errors():
+    def _check_process_errors(self, names: List[str]):
+        """启动一段时间后检查这些实例 stderr 日志中的错误，同一批实例的错误合并到一个提示框"""
+        # 只检查写入了 stderr 日志的实例
+        names = [name for name in names if name in self._stderr_offsets]
+        if not names:
+            return
+        # 已退出的实例在退出时报告
+        QTimer.singleShot(Constants.STDERR_CHECK_DELAY, lambda: self._report_process_errors(
+            [name for name in names if name in self.running_instances]))
+
+    def _read_stderr_tail(self, instance_name: str, start: int = 0) -> Tuple[str, int]:
+        """读取实例 stderr 日志中 start 之后的最后若干行，只读取文件末尾有限的字节数
+
+        返回 (内容, 文件末尾位置)；日志轮转后 start 超出文件长度时从头读取。
+        """
+        with open(self._stderr_log_path(instance_name), 'rb') as f:
+            end = f.seek(0, os.SEEK_END)
+            if start > end:
+                start = 0
+            f.seek(max(start, end - Constants.STDERR_TAIL_BYTES))
+            data = f.read().decode('utf-8', errors='replace')
+        return ''.join(deque(data.splitlines(True), maxlen=Constants.STDERR_TAIL_LINES)), end
+
+    def _report_process_errors(self, names: List[str], exited: bool = False):
+        """记录实例 stderr 中尚未报告的输出，有严重错误时合并成一个提示框"""
+        stage = "运行" if exited else "启动"
+        severe = []
+        for name in names:
             try:
-                errors = process.stderr.read()
-                if errors and errors.strip():
-                    logger.warning(f"实例 {instance_name} 启动警告: {errors}")
-                    # 只在有严重错误时才弹窗
-                    if "FATAL" in errors or "ERROR" in errors:
-                        QTimer.singleShot(0, lambda: QMessageBox.warning(
-                            self, "启动警告", f"实例 {instance_name} 启动时出现错误:\n{errors[:500]}..."
-                        ))
-            except Exception as e:
+                errors, self._stderr_offsets[name] = self._read_stderr_tail(
+                    name, self._stderr_offsets.get(name, 0))
+            except OSError as e:
                 logger.error(f"读取进程错误信息失败: {e}")
-        
-        threading.Thread(target=read_errors, daemon=True).start()
+                continue
+            if errors.strip():
+                logger.warning(f"实例 {name} {stage}警告: {errors}")
+                # 只在有严重错误时才弹窗
+                if "FATAL" in errors or "ERROR" in errors:
+                    severe.append(f"实例 {name}:\n{errors[:500]}...")
+        if severe:
+            message = f"以下实例{stage}时出现错误:\n\n" + "\n\n".join(severe)
+            # 模态框会运行嵌套事件循环，延后到调用方返回后再弹出，避免状态检查在遍历实例时重入
+            QTimer.singleShot(0, lambda: QMessageBox.warning(self, f"{stage}警告", message))
+
+    def _report_exited_instances(self):
+        """报告本轮退出的实例在退出前新增的 stderr 输出"""
+        # 已被重新启动的实例不再报告
+        names = [name for name in self._exited_pending if name not in self.running_instances]
+        self._exited_pending = []
+        self._report_process_errors(names, exited=True)
+        for name in names:
+            self._stderr_offsets.pop(name, None)
+
+    def _schedule_stderr_rotation(self, names: List[str]):
+        """在线程池中轮转运行中实例的 stderr 日志，UI线程不 stat 或复制日志文件"""
+        if self._stderr_rotating:
+            return
+        paths = {name: self._stderr_log_path(name) for name in names if name in self._stderr_offsets}
+        if not paths:
+            return
+        self._stderr_rotating = True
+        QThreadPool.globalInstance().start(
+            lambda: self.stderr_logs_rotated.emit(self._rotate_stderr_logs(paths)))
+
+    @staticmethod
+    def _rotate_stderr_logs(paths: Dict[str, str]) -> List[str]:
+        """超过上限的 stderr 日志复制到 .1 备份后原地清空，返回轮转过的实例名称
+
+        进程仍持有日志文件句柄，重命名后会继续写入旧文件，所以只能复制后原地截断。
+        """
+        rotated = []
+        for name, path in paths.items():
+            try:
+                if os.stat(path).st_size <= Constants.STDERR_LOG_MAX_BYTES:
+                    continue
+                shutil.copyfile(path, path + '.1')
+                os.truncate(path, 0)
+            except OSError as e:
+                logger.debug(f"轮转 stderr 日志失败: {e}")
+                continue
+            rotated.append(name)
+        return rotated
+
+    def _on_stderr_logs_rotated(self, names: List[str]):
+        """日志轮转完成，之后从文件开头报告新的输出"""
+        self._stderr_rotating = False
+        for name in names:
+            if name in self._stderr_offsets:
+                self._stderr_offsets[name] = 0
 
     def stop_instance(self, instance: Dict):
         """停止单个实例"""
@@ -1368,14 +2434,14 @@ class ChromiumManager(QMainWindow):
                 process.kill()
                 process.wait(timeout=2)
             
-            del self.running_instances[instance_name]
-            self.update_table()
+            self._remove_running_instance(instance_name)
+            self.refresh_statuses()
             logger.info(f"实例 {instance_name} 已停止")
             
         except psutil.NoSuchProcess:
             logger.warning(f"进程不存在，清理实例状态: {instance_name}")
-            del self.running_instances[instance_name]
-            self.update_table()
+            self._remove_running_instance(instance_name)
+            self.refresh_statuses()
         except psutil.AccessDenied:
             QMessageBox.critical(self, "错误", f"没有权限停止实例 {instance_name}")
         except Exception as e:
@@ -1389,26 +2455,35 @@ class ChromiumManager(QMainWindow):
             QMessageBox.warning(self, "警告", "请先选择要启动的实例")
             return
 
-        success_count = 0
-        failed_instances = []
+        if self._batch_pending:
+            QMessageBox.information(self, "提示", "上一次批量启动尚未完成，请稍候")
+            return
+
+        self._batch_success = 0
+        self._batch_failed = []
+        self._batch_launched = []
         
-        for instance in selected:
-            if instance['name'] not in self.running_instances:
-                try:
-                    self.start_instance(instance)
-                    success_count += 1
-                except Exception as e:
-                    failed_instances.append(f"{instance['name']}: {str(e)}")
-                    logger.error(f"批量启动失败 {instance['name']}: {e}")
+        # 在UI线程中解析路径和命令（可能更新配置），进程创建交给线程池并行执行
+        launches = []
+        with self._suspend_saves():
+            for instance in selected:
+                if instance['name'] in self.running_instances:
+                    continue
+                chromium_path = self.get_chromium_path(instance.get('chromium_version', 'default'))
+                if not chromium_path:
+                    self._batch_failed.append(f"{instance['name']}: 找不到 Chromium 可执行文件")
+                    continue
+                launches.append((instance['name'], self._build_chromium_command(chromium_path, instance)))
         
-        # 显示结果
-        if failed_instances:
-            QMessageBox.warning(
-                self, "批量启动结果", 
-                f"成功启动 {success_count} 个实例\n失败的实例:\n" + "\n".join(failed_instances)
-            )
-        else:
-            QMessageBox.information(self, "成功", f"成功启动 {success_count} 个实例")
+        if not launches:
+            self._show_batch_start_result()
+            return
+        
+        self._batch_pending = len(launches)
+        for instance_name, cmd in launches:
+            logger.info(f"启动实例: {instance_name}")
+            self._launch_futures[instance_name] = self._launch_pool.submit(
+                self._launch_worker, instance_name, cmd)
 
     def batch_stop_instances(self):
         """批量停止实例"""
@@ -1417,17 +2492,14 @@ class ChromiumManager(QMainWindow):
             QMessageBox.warning(self, "警告", "请先选择要停止的实例")
             return
 
-        success_count = 0
-        failed_instances = []
+        targets = {instance['name']: self.running_instances[instance['name']]
+                   for instance in selected if instance['name'] in self.running_instances}
+        stopped, failed_instances = self._terminate_instances(targets, timeout=5, kill_timeout=2)
+        for name in stopped:
+            self._remove_running_instance(name)
+        success_count = len(stopped)
         
-        for instance in selected:
-            if instance['name'] in self.running_instances:
-                try:
-                    self.stop_instance(instance)
-                    success_count += 1
-                except Exception as e:
-                    failed_instances.append(f"{instance['name']}: {str(e)}")
-                    logger.error(f"批量停止失败 {instance['name']}: {e}")
+        self.refresh_statuses()
         
         # 显示结果
         if failed_instances:
@@ -1438,33 +2510,124 @@ class ChromiumManager(QMainWindow):
         else:
             QMessageBox.information(self, "成功", f"成功停止 {success_count} 个实例")
 
+    def _terminate_instances(self, targets: Dict[str, int], timeout: float,
+                             kill_timeout: float) -> Tuple[List[str], List[str]]:
+        """并发停止多个实例：先全部发送终止信号再统一等待，超时后强制结束
+
+        返回 (已停止的实例名称, 失败信息)，总耗时取决于最慢的进程而非耗时之和。
+        """
+        stopped: List[str] = []
+        failed: List[str] = []
+        procs: List[psutil.Process] = []
+        names: Dict[int, str] = {}
+        # 用一次PID快照过滤掉已退出的进程，避免为其构造 Process 对象再走异常分支
+        live_pids = set(psutil.pids())
+        for name, pid in targets.items():
+            if pid not in live_pids:
+                logger.debug(f"实例 {name} 的进程已退出")
+                stopped.append(name)
+                continue
+            try:
+                proc = psutil.Process(pid)
+                logger.info(f"正在停止实例: {name} (PID: {pid})")
+                proc.terminate()
+                procs.append(proc)
+                names[pid] = name
+            except psutil.NoSuchProcess:
+                logger.warning(f"进程不存在，清理实例状态: {name}")
+                stopped.append(name)
+            except psutil.Error as e:
+                failed.append(f"{name}: {str(e)}")
+                logger.error(f"停止实例 {name} 时出错: {e}")
+        
+        _, alive = psutil.wait_procs(procs, timeout=timeout)
+        if alive:
+            for proc in alive:
+                logger.warning(f"实例 {names[proc.pid]} 未能优雅关闭，强制终止")
+                try:
+                    proc.kill()
+                except psutil.NoSuchProcess:
+                    pass
+            _, alive = psutil.wait_procs(alive, timeout=kill_timeout)
+        
+        alive_pids = {proc.pid for proc in alive}
+        for proc in procs:
+            name = names[proc.pid]
+            if proc.pid in alive_pids:
+                failed.append(f"{name}: 进程未能终止")
+                logger.error(f"停止实例 {name} 失败: 进程未能终止")
+            else:
+                stopped.append(name)
+                logger.info(f"实例 {name} 已停止")
+        return stopped, failed
+
+    def _remove_running_instance(self, name: str):
+        """移除实例的运行状态，并报告退出前 stderr 中新增的错误"""
+        # 弹窗等嵌套事件循环中状态检查可能已移除该实例
+        self.running_instances.pop(name, None)
+        self._processes.pop(name, None)
+        if name in self._stderr_offsets and name not in self._exited_pending:
+            # 同一轮中退出的实例合并报告
+            if not self._exited_pending:
+                QTimer.singleShot(0, self._report_exited_instances)
+            self._exited_pending.append(name)
+    
+    def _reset_status_timer(self):
+        """有实例运行时恢复正常的状态检查频率"""
+        self._idle_ticks = 0
+        self._update_timer_interval()
+    
+    def _update_timer_interval(self):
+        """按当前状态选择检查频率：长时间无实例运行或窗口不在前台时降低频率"""
+        if self.timer is None:
+            return
+        if self._idle_ticks >= Constants.PROCESS_STATUS_IDLE_TICKS:
+            interval = Constants.PROCESS_STATUS_IDLE_INTERVAL
+        elif not self.isActiveWindow():
+            interval = Constants.PROCESS_STATUS_BACKGROUND_INTERVAL
+        else:
+            interval = Constants.PROCESS_STATUS_UPDATE_INTERVAL
+        if self.timer.interval() != interval:
+            self.timer.setInterval(interval)
+    
+    def changeEvent(self, event):
+        """窗口激活状态变化时调整状态检查频率"""
+        if event.type() == QEvent.Type.ActivationChange:
+            self._update_timer_interval()
+        super().changeEvent(event)
+    
+    def is_instance_running(self, name: str, pid: int) -> bool:
+        """判断实例是否仍在运行"""
+        # 由本程序启动的子进程直接用 poll() 检查，同时回收已退出的僵尸进程，无需枚举系统进程
+        process = self._processes.get(name)
+        if process is not None:
+            return process.poll() is None
+        return psutil.pid_exists(pid)
+
     def update_process_status(self):
         """更新进程状态"""
         try:
-            # 检查所有运行中的进程是否还存在
-            dead_instances = []
-            for name, pid in list(self.running_instances.items()):
-                try:
-                    process = psutil.Process(pid)
-                    if not process.is_running() or process.status() == psutil.STATUS_ZOMBIE:
-                        dead_instances.append(name)
-                except psutil.NoSuchProcess:
-                    dead_instances.append(name)
-                except psutil.AccessDenied:
-                    # 进程存在但无法访问，保持状态
-                    continue
-                except Exception as e:
-                    logger.warning(f"检查进程状态失败 {name}: {e}")
-                    continue
+            if not self.running_instances:
+                # 空闲时降低检查频率
+                self._idle_ticks += 1
+                if self._idle_ticks == Constants.PROCESS_STATUS_IDLE_TICKS:
+                    self._update_timer_interval()
+                return
+            
+            dead_instances = [name for name, pid in self.running_instances.items()
+                              if not self.is_instance_running(name, pid)]
+            
+            self._schedule_stderr_rotation([name for name in self.running_instances
+                                            if name not in dead_instances])
             
             # 清理已死亡的进程
             for name in dead_instances:
-                del self.running_instances[name]
+                self._remove_running_instance(name)
                 logger.debug(f"清理已停止的实例: {name}")
             
             # 只有在有变化时才更新表格
             if dead_instances:
-                self.update_table()
+                self.refresh_statuses()
                 
         except Exception as e:
             logger.error(f"更新进程状态失败: {e}")
@@ -1489,111 +2652,116 @@ class ChromiumManager(QMainWindow):
             self.env_label.setText("未选中实例")
             return
         inst = self.config['instances'][row]
-        # 这里可根据你的需求扩展更多参数
-        env_text = (
-            f"语言: 基于 IP 匹配\n"
-            f"时区: {inst.get('timezone', '')}\n"
-            f"分辨率: {inst.get('resolution', '')}\n"
-            f"字体指纹: {inst.get('font_fingerprint', '')}\n"
-            f"WebRTC: {inst.get('webrtc', '')}\n"
-            f"WebGL 图像: {inst.get('webgl_image', '')}\n"
-            f"WebGL Info: {inst.get('webgl_info', '')}\n"
-            f"Canvas: {inst.get('canvas', '')}\n"
-            f"AudioContext: {inst.get('audiocontext', '')}\n"
-            f"Speech Voices: {inst.get('speech_voices', '')}\n"
-            f"Do Not Track: {inst.get('do_not_track', '')}\n"
-            f"Client Rects: {inst.get('client_rects', '')}\n"
-            f"媒体设备: {inst.get('media_devices', '')}\n"
-            f"设备名称: {inst.get('device_name', '')}\n"
-            f"MAC地址: {inst.get('mac_address', '')}\n"
-            f"硬件并发数: {inst.get('hardware_concurrency', '')}核\n"
-            f"设备内存: {inst.get('device_memory', '')}G\n"
-            f"SSL指纹设置: {inst.get('ssl_fingerprint', '')}\n"
-            f"喇叭扫描保护: {inst.get('speaker_protection', '')}\n"
-        )
-        self.env_label.setText(env_text)
-        # ... existing code ...
-        # 记得在表格选中行变化时调用 self.update_env_info()
-        self.table.currentCellChanged.connect(lambda *_: self.update_env_info())
+        self.env_label.setText(Constants.ENV_INFO_TEMPLATE.format_map(defaultdict(str, inst)))
+
+    def _schedule_env_info_update(self, *_):
+        """合并同一轮事件循环中的多次选中行变化，只刷新一次环境参数区"""
+        if self._env_info_pending:
+            return
+        self._env_info_pending = True
+        QTimer.singleShot(0, self._flush_env_info_update)
+
+    def _flush_env_info_update(self):
+        self._env_info_pending = False
+        self.update_env_info()
 
     def closeEvent(self, event):
         """关闭应用时的清理工作"""
         logger.info("正在关闭应用...")
         
         # 停止定时器
-        if hasattr(self, 'timer'):
+        if self.timer is not None:
             self.timer.stop()
+        self._save_timer.stop()
+        
+        # 取消尚未开始的启动任务，等待正在进行的任务完成
+        for future in self._launch_futures.values():
+            future.cancel()
+        self._launch_pool.shutdown(wait=True)
+        # 已启动但结果信号尚未在UI线程处理的进程也要一并停止
+        targets = dict(self.running_instances)
+        for instance_name, future in self._launch_futures.items():
+            process = None if future.cancelled() else future.result()
+            if process is not None:
+                targets.setdefault(instance_name, process.pid)
+        
+        # 丢弃尚未返回的网络请求结果，只短暂等待，网络缓慢时不阻塞关闭
+        for thread in (self._ip_thread, self._versions_thread):
+            if thread and thread.isRunning():
+                thread.result.disconnect()
+                if not thread.wait(Constants.FETCH_THREAD_EXIT_WAIT):
+                    # 保留引用，避免线程在运行中被销毁
+                    _detached_threads.append(thread)
         
         # 停止所有运行的实例
-        if self.running_instances:
-            logger.info(f"正在停止 {len(self.running_instances)} 个运行中的实例...")
-            for name, pid in list(self.running_instances.items()):
-                try:
-                    process = psutil.Process(pid)
-                    process.terminate()
-                    # 给进程一些时间优雅关闭
-                    try:
-                        process.wait(timeout=3)
-                    except psutil.TimeoutExpired:
-                        process.kill()
-                    logger.debug(f"实例 {name} 已停止")
-                except psutil.NoSuchProcess:
-                    pass
-                except Exception as e:
-                    logger.warning(f"停止实例 {name} 时出错: {e}")
+        if targets:
+            logger.info(f"正在停止 {len(targets)} 个运行中的实例...")
+            self._terminate_instances(targets, timeout=3, kill_timeout=1)
         
-        # 保存配置
-        self.save_config()
+        # 保存未写入的配置
+        if self._config_dirty:
+            self._save_config_in_background()
         
         logger.info("应用已关闭")
         event.accept()
 
-    def update_version_config(self, version: str, path: str):
-        """更新版本配置"""
-        if 'versions' not in self.config:
-            self.config['versions'] = {}
-        
-        self.config['versions'][version] = {
+    def update_version_config(self, version: str, path: str, st: Optional[os.stat_result] = None,
+                              archive_sha256: Optional[str] = None):
+        """更新版本配置，调用方已有可执行文件的 stat 结果时可直接传入
+
+        archive_sha256 记录安装所用压缩包的哈希，再次下载同一压缩包时可跳过解压。
+        """
+        if st is None:
+            st = FileExtractor.stat_file(path)
+        new_entry = {
             'path': path,
             'type': 'downloaded',
             'description': f'下载版本 {version}',
-            'last_updated': os.path.getmtime(path) if os.path.exists(path) else 0
+            'last_updated': st.st_mtime if st else 0
         }
-        self.save_config()
+        versions = self.config.setdefault('versions', {})
+        existing = versions.get(version) or {}
+        if archive_sha256:
+            new_entry['archive_sha256'] = archive_sha256
+        elif existing.get('path') == path and 'archive_sha256' in existing:
+            # 路径未变时保留原有的压缩包哈希
+            new_entry['archive_sha256'] = existing['archive_sha256']
+        # 内容未变化时不写文件
+        if existing == new_entry:
+            return
+        versions[version] = new_entry
+        self._config_dirty = True
+        if not self._save_suspended:
+            self.save_config()
+        self.invalidate_version_cache(version)
         logger.info(f"版本配置已更新: {version} -> {path}")
 
+    @contextmanager
+    def _suspend_saves(self):
+        """在代码块内暂停版本配置的即时保存，结束时若有修改只写一次文件"""
+        self._save_suspended += 1
+        try:
+            yield
+        finally:
+            self._save_suspended -= 1
+            if not self._save_suspended and self._config_dirty:
+                self.save_config()
+
+    def invalidate_version_cache(self, version: str):
+        """清除某个版本的查找缓存（包括未找到的结果）"""
+        self._has_version_cache.pop(version, None)
+        self._chromium_path_cache.pop(version, None)
+
     def has_version(self, version: str) -> bool:
-        """判断某个版本是否已下载（可用）"""
-        # 首先检查配置中的路径
-        version_config = self.config.get('versions', {}).get(version, {})
-        if version_config.get('path') and os.path.exists(version_config['path']):
-            return True
-        
-        # 动态查找版本目录
-        version_dir = os.path.join(self.platform_dir, version)
-        if not os.path.exists(version_dir):
-            return False
-        
-        # 根据平台查找可执行文件
-        if self.is_windows:
-            possible_paths = [
-                os.path.join(version_dir, 'chrome.exe'),
-                os.path.join(version_dir, 'Chromium', 'chrome.exe'),
-                os.path.join(version_dir, 'chrome-win', 'chrome.exe')
-            ]
-        else:
-            possible_paths = [
-                os.path.join(version_dir, 'Chromium.app', 'Contents', 'MacOS', 'Chromium'),
-                os.path.join(version_dir, 'Chromium', 'Contents', 'MacOS', 'Chromium')
-            ]
-        
-        for path in possible_paths:
-            if os.path.exists(path):
-                # 更新配置
-                self.update_version_config(version, path)
-                return True
-        
-        return False
+        """判断某个版本是否已下载（可用），结果短时间缓存"""
+        now = time.monotonic()
+        cached = self._has_version_cache.get(version)
+        if cached and now - cached[0] < Constants.HAS_VERSION_CACHE_TTL:
+            return cached[1] is not None
+        
+        path = self._resolve_version_path(version)
+        self._has_version_cache[version] = (now, path)
+        return path is not None
 
 def main():
     app = QApplication(sys.argv)
@@ -5,6 +5,7 @@ Chromium 多实例管理器启动脚本
 import sys
 import os
 import platform
+import importlib.util
 
 def check_environment():
     """检查运行环境"""
@@ -33,11 +34,11 @@ def check_environment():
     required_modules = ['PyQt6', 'psutil', 'yaml', 'requests']
     missing_modules = []
     
+    # 只查找模块而不执行导入，真正的导入由主程序完成
     for module in required_modules:
-        try:
-            __import__(module)
+        if importlib.util.find_spec(module) is not None:
             print(f"✅ {module} 已安装")
-        except ImportError:
+        else:
             print(f"❌ {module} 未安装")
             missing_modules.append(module)
     
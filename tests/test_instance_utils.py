@@ -0,0 +1,34 @@
+import importlib.util
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+REQUIRED = ('PyQt6', 'psutil', 'yaml', 'requests')
+MISSING = [name for name in REQUIRED if importlib.util.find_spec(name) is None]
+
+
+@unittest.skipIf(MISSING, f"缺少依赖: {', '.join(MISSING)}")
+class GetNextNumbersTest(unittest.TestCase):
+
+    def setUp(self):
+        from chromium_manager import InstanceUtils
+        self.get_next_numbers = InstanceUtils.get_next_numbers
+
+    def test_fingerprint_defaults_to_1000(self):
+        self.assertEqual(self.get_next_numbers([], False)[2], 1000)
+        self.assertEqual(self.get_next_numbers([{'fingerprint': 'abc'}], False)[2], 1000)
+
+    def test_fingerprint_follows_existing_maximum(self):
+        instances = [{'name': 'Instance 1', 'fingerprint': '5',
+                      'user_data_dir': '/tmp/chromium/default001'}]
+        self.assertEqual(self.get_next_numbers(instances, False), (2, 2, 6))
+
+    def test_fingerprint_accepts_int_values(self):
+        instances = [{'fingerprint': 3}, {'fingerprint': '1200'}]
+        self.assertEqual(self.get_next_numbers(instances, False)[2], 1201)
+
+
+if __name__ == '__main__':
+    unittest.main()